@@ -6,39 +6,57 @@ using Grok-4-1-Fast with compressed directive prompts.
 Integrates with X API to fetch real tweets.
 """
 
+import heapq
 import json
 import os
 import asyncio
+import re
+import threading
 import time
+
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
-# Load environment variables
+# Load environment variables (once per process - several backend modules
+# import this fallback, so guard against reparsing .env on every import)
 try:
     from dotenv import load_dotenv
     env_path = Path(__file__).parent / '.env'
     load_dotenv(env_path)
 except ImportError:
-    env_path = Path(__file__).parent / '.env'
-    if env_path.exists():
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key] = value
+    if not os.environ.get("_ENV_LOADED"):
+        env_path = Path(__file__).parent / '.env'
+        if env_path.exists():
+            with open(env_path) as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith('#') and '=' in line:
+                        key, value = line.split('=', 1)
+                        os.environ.setdefault(key.strip(), value.strip())
+        os.environ["_ENV_LOADED"] = "1"
 
 from grok_pipeline.grok_client import GrokClient
 from auth.utils import get_client
 
+# orjson is 2-5x faster than stdlib json for the serialization hot paths;
+# fall back to stdlib when unavailable.
+try:
+    import orjson
+
+    def _dumps_indented(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _dumps_indented(obj: Any) -> str:
+        return json.dumps(obj, indent=2, default=str)
+
 
+# The RULING CRITERIA block is prepended at import time (see
+# _SYSTEM_PROMPT_STATIC_PREFIX below) so the large static text never goes
+# through .format and leads the prompt as the cacheable prefix.
 ANALYSIS_SYSTEM_PROMPT = """You are an analytic engine monitoring X (Twitter) for the prediction event: **"{event_description}"**
 Operate as a strict extractor of military-relevant signals. No narrative. No speculation beyond evidence.
 
-**RULING CRITERIA**
-{ruling_criteria}
-
 **PROCESS**
 1. Analyze provided tweets from prominent figures
 2. Filter for relevance to {location} (variants: {location_variants})
@@ -91,22 +109,186 @@ RULING_CRITERIA = {
     }
 }
 
+# Serialized once at import so the system prompt prefix is byte-identical
+# across calls - a requirement for provider-side prompt-cache hits. The
+# JSON contains braces, so it is concatenated rather than .format-ed.
+_RULING_CRITERIA_JSON = _dumps_indented(RULING_CRITERIA)
+_SYSTEM_PROMPT_STATIC_PREFIX = f"**RULING CRITERIA**\n{_RULING_CRITERIA_JSON}\n\n"
 
-def fetch_tweets_from_figures(
+
+# Cap on concurrent X API requests (the xdk client is sync, so each request
+# runs in a thread; the semaphore bounds both threads and rate pressure)
+MAX_CONCURRENT_FETCHES = 8
+
+# Cap on concurrent per-figure Grok analysis calls (respects Grok rate limits)
+MAX_CONCURRENT_ANALYSES = 5
+
+# Per-tweet prompt budget. 280 chars is the canonical tweet length, so most
+# tweets fit untruncated; long-form posts get clipped to keep token cost flat.
+MAX_TWEET_CHARS = 280
+
+
+class _AsyncTokenBucket:
+    """
+    Minimal async token-bucket limiter for X API pacing.
+
+    Requests fire as fast as remaining quota allows instead of a blanket
+    1s sleep per figure, while still never exceeding the bucket rate.
+    """
+
+    def __init__(self, rate: int, period: float):
+        self._capacity = rate
+        self._fill_rate = rate / period
+        self._tokens = float(rate)
+        self._last_refill = time.monotonic()
+        # threading.Lock so one bucket serves every event loop (the sync
+        # wrapper creates a loop per asyncio.run); the token arithmetic
+        # never awaits, and the sleep happens outside the lock
+        self._lock = threading.Lock()
+
+    async def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._last_refill) * self._fill_rate
+                )
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_seconds = (1 - self._tokens) / self._fill_rate
+            await asyncio.sleep(wait_seconds)
+
+
+# X API v2 recent-search app limit is 450 requests / 15 minutes
+_search_rate_limiter = _AsyncTokenBucket(rate=450, period=900)
+
+
+def _compile_keyword_matcher(keywords: List[str]):
+    """
+    Precompile a single multi-literal pattern over the location keywords.
+
+    Tweets that never mention the location (or a variant) are NOISE by the
+    ruling criteria, so they can be dropped locally with one scan per tweet
+    instead of spending Grok tokens on them.
+    """
+    pattern = re.compile(
+        "|".join(re.escape(kw) for kw in keywords if kw),
+        re.IGNORECASE
+    )
+    return pattern.search
+
+
+def _fetch_tweets_for_figure(
+    client,
+    figure: Dict[str, Any],
+    days_back: int,
+    max_tweets_per_figure: int,
+    start_time_iso: str
+) -> List[Dict[str, Any]]:
+    """
+    Fetch tweets for a single figure (sync - runs in a worker thread).
+    """
+    handle = figure.get('x_handle', '').replace('@', '')
+    name = figure.get('name', 'Unknown')
+
+    # Build simple query - just from:handle
+    query = f"from:{handle} -is:retweet"
+
+    # Determine API method and max_results per page
+    # API usually caps at 100 per request
+    api_max = 100
+
+    # Use search_all for > 7 days, search_recent for <= 7 days
+    if days_back > 7:
+        response = client.posts.search_all(
+            query=query,
+            max_results=api_max,
+            start_time=start_time_iso
+        )
+    else:
+        response = client.posts.search_recent(
+            query=query,
+            max_results=api_max,
+            start_time=start_time_iso
+        )
+
+    tweets = []
+    count = 0
+
+    # The response is a generator of pages
+    # Iterate through pages
+    for page in response:
+        # Check for data in page
+        tweet_data = None
+        if hasattr(page, 'data'):
+            tweet_data = page.data
+        elif isinstance(page, dict) and 'data' in page:
+            tweet_data = page['data']
+
+        if not tweet_data:
+            continue
+
+        # Iterate through tweets in page
+        for tweet in (tweet_data if isinstance(tweet_data, list) else [tweet_data]):
+            # Extract fields - handle both dict and object
+            if isinstance(tweet, dict):
+                tweet_text = tweet.get("text", "")
+                tweet_id = tweet.get("id", "")
+                author_id = tweet.get("author_id", "")
+                created_at = tweet.get("created_at", "")
+            else:
+                tweet_text = getattr(tweet, "text", "") or ""
+                tweet_id = getattr(tweet, "id", "") or ""
+                author_id = getattr(tweet, "author_id", "") or ""
+                created_at = getattr(tweet, "created_at", "") or ""
+
+            tweet_dict = {
+                "id": str(tweet_id),
+                "text": str(tweet_text),
+                "author_id": str(author_id),
+                "created_at": str(created_at),
+                "handle": f"@{handle}",
+                "author_name": name
+            }
+            tweets.append(tweet_dict)
+            count += 1
+
+            # Check limit if set
+            if max_tweets_per_figure and count >= max_tweets_per_figure:
+                break
+
+        # Check limit if set
+        if max_tweets_per_figure and count >= max_tweets_per_figure:
+            break
+
+    return tweets
+
+
+async def fetch_tweets_from_figures_async(
     figures: List[Dict[str, Any]],
     location_keywords: List[str],
     days_back: int = 7,
-    max_tweets_per_figure: int = 20
+    max_tweets_per_figure: int = 20,
+    start_time: Optional[datetime] = None
 ) -> Dict[str, List[Dict[str, Any]]]:
     """
-    Fetch real tweets from X API for each prominent figure.
-    
+    Fetch real tweets from X API for each prominent figure, concurrently.
+
+    The per-figure searches are I/O-bound, so they run in worker threads
+    behind a bounded semaphore instead of the old serial loop with a hard
+    1s sleep between figures.
+
     Args:
         figures: List of prominent figure dicts with 'x_handle'
         location_keywords: Keywords to search for (e.g., ['Pokrovsk', 'Pokrovs\'k'])
         days_back: How many days back to search
         max_tweets_per_figure: Max tweets to fetch per figure
-    
+        start_time: Window start (UTC). Defaults to now minus days_back;
+            pass it explicitly to share one window with the caller.
+
     Returns:
         Dict mapping handle to list of tweets
     """
@@ -114,125 +296,76 @@ def fetch_tweets_from_figures(
     print(f"📍 Keywords: {', '.join(location_keywords)}")
     print(f"⏰ Last {days_back} days")
     print()
-    
+
     client = get_client(auth_type='bearer')
-    
-    # Calculate date range
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=days_back)
-    since_str = start_date.strftime('%Y-%m-%d')
-    
-    tweets_by_figure = {}
-    
-    for i, figure in enumerate(figures, 1):
+
+    # Format start_time for API (ISO 8601) once - identical window for all figures
+    # tweets search API expects YYYY-MM-DDTHH:mm:ssZ
+    if start_time is None:
+        start_time = datetime.utcnow() - timedelta(days=days_back)
+    start_time_iso = start_time.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    if days_back > 7:
+        print(f"    Using Full Archive Search (Last {days_back} days)...")
+
+    tweets_by_figure: Dict[str, List[Dict[str, Any]]] = {}
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+    async def _fetch_one(i: int, figure: Dict[str, Any]):
         handle = figure.get('x_handle', '').replace('@', '')
         name = figure.get('name', 'Unknown')
-        
+
         if not handle:
             print(f"  [{i}/{len(figures)}] {name}: No handle, skipping")
-            continue
-        
-        print(f"  [{i}/{len(figures)}] {name} (@{handle})...", end=" ", flush=True)
-        
-        # Build simple query - just from:handle
-        query = f"from:{handle} -is:retweet"
-        
-        try:
-            # Add delay to avoid rate limits
-            time.sleep(1)
-            
-            # Format start_time for API (ISO 8601)
-            # tweets search API expects YYYY-MM-DDTHH:mm:ssZ
-            start_time_iso = (datetime.utcnow() - timedelta(days=days_back)).strftime('%Y-%m-%dT%H:%M:%SZ')
-            
-            # Determine API method and max_results per page
-            # API usually caps at 100 per request
-            api_max = 100 
-            
-            # Use search_all for > 7 days, search_recent for <= 7 days
-            if days_back > 7:
-                print(f"    Using Full Archive Search (Last {days_back} days)...")
-                response = client.posts.search_all(
-                    query=query,
-                    max_results=api_max, 
-                    start_time=start_time_iso
-                )
-            else:
-                response = client.posts.search_recent(
-                    query=query,
-                    max_results=api_max,
-                    start_time=start_time_iso
+            return
+
+        async with semaphore:
+            # Token-bucket pacing keyed to the X API quota instead of a
+            # fixed 1s stall per figure
+            await _search_rate_limiter.acquire()
+            try:
+                tweets = await asyncio.to_thread(
+                    _fetch_tweets_for_figure,
+                    client, figure, days_back, max_tweets_per_figure, start_time_iso
                 )
-            
-            tweets = []
-            count = 0
-            
-            # The response is a generator of pages
-            # Iterate through pages
-            for page in response:
-                # Check for data in page
-                tweet_data = None
-                if hasattr(page, 'data'):
-                    tweet_data = page.data
-                elif isinstance(page, dict) and 'data' in page:
-                    tweet_data = page['data']
-                
-                if not tweet_data:
-                    continue
-                    
-                # Iterate through tweets in page
-                for tweet in (tweet_data if isinstance(tweet_data, list) else [tweet_data]):
-                    # Extract fields - handle both dict and object
-                    if isinstance(tweet, dict):
-                        tweet_text = tweet.get("text", "")
-                        tweet_id = tweet.get("id", "")
-                        author_id = tweet.get("author_id", "")
-                        created_at = tweet.get("created_at", "")
-                    else:
-                        tweet_text = getattr(tweet, "text", "") or ""
-                        tweet_id = getattr(tweet, "id", "") or ""
-                        author_id = getattr(tweet, "author_id", "") or ""
-                        created_at = getattr(tweet, "created_at", "") or ""
-                    
-                    tweet_dict = {
-                        "id": str(tweet_id),
-                        "text": str(tweet_text),
-                        "author_id": str(author_id),
-                        "created_at": str(created_at),
-                        "handle": f"@{handle}",
-                        "author_name": name
-                    }
-                    tweets.append(tweet_dict)
-                    count += 1
-                    
-                    # Check limit if set
-                    if max_tweets_per_figure and count >= max_tweets_per_figure:
-                        break
-                
-                # Check limit if set
-                if max_tweets_per_figure and count >= max_tweets_per_figure:
-                    break
-            
-            tweets_by_figure[f"@{handle}"] = tweets
-            print(f"✓ {count} tweets")
-            
-        except Exception as e:
-            print(f"✗ Error: {str(e)[:50]}")
-            tweets_by_figure[f"@{handle}"] = []
-            
-            # If rate limited, wait longer
-            if "429" in str(e):
-                print("    ⚠️  Rate limit hit. Waiting 15 seconds...")
-                time.sleep(15)
-    
+                tweets_by_figure[f"@{handle}"] = tweets
+                print(f"  [{i}/{len(figures)}] {name} (@{handle})... ✓ {len(tweets)} tweets")
+            except Exception as e:
+                print(f"  [{i}/{len(figures)}] {name} (@{handle})... ✗ Error: {str(e)[:50]}")
+                tweets_by_figure[f"@{handle}"] = []
+
+                # If rate limited, back off before releasing the slot
+                if "429" in str(e):
+                    print("    ⚠️  Rate limit hit. Waiting 15 seconds...")
+                    await asyncio.sleep(15)
+
+    await asyncio.gather(*(_fetch_one(i, f) for i, f in enumerate(figures, 1)))
+
     total_tweets = sum(len(tweets) for tweets in tweets_by_figure.values())
     print()
     print(f"📊 Total tweets fetched: {total_tweets}")
     print()
-    
+
     return tweets_by_figure
 
 
+def fetch_tweets_from_figures(
+    figures: List[Dict[str, Any]],
+    location_keywords: List[str],
+    days_back: int = 7,
+    max_tweets_per_figure: int = 20
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Synchronous wrapper around fetch_tweets_from_figures_async."""
+    return asyncio.run(
+        fetch_tweets_from_figures_async(
+            figures=figures,
+            location_keywords=location_keywords,
+            days_back=days_back,
+            max_tweets_per_figure=max_tweets_per_figure
+        )
+    )
+
+
 async def analyze_tweets_for_event(
     prominent_figures_file: str,
     event_description: str,
@@ -272,23 +405,37 @@ async def analyze_tweets_for_event(
     print(f"👥 Loaded {len(figures)} prominent figures")
     print()
     
-    # Calculate date range
-    end_date = datetime.now()
+    # Calculate date range once; the fetcher reuses the same window so every
+    # figure (and the reported analysis period) shares identical bounds
+    end_date = datetime.utcnow()
     start_date = end_date - timedelta(days=days_back)
-    
+
     # STEP 1: Fetch REAL tweets from X API
     print("🔍 Fetching tweets from X API...")
     all_keywords = [location] + location_variants
-    tweets_by_figure = fetch_tweets_from_figures(
+    tweets_by_figure = await fetch_tweets_from_figures_async(
         figures=figures,
         location_keywords=all_keywords,
         days_back=days_back,
-        max_tweets_per_figure=max_tweets
+        max_tweets_per_figure=max_tweets,
+        start_time=start_date
     )
     
     # Count total tweets
     total_tweets_fetched = sum(len(tweets) for tweets in tweets_by_figure.values())
-    
+
+    # Pre-filter locally: drop tweets that never mention the location or a
+    # variant so Grok only sees candidate signal, not obvious noise.
+    matches_location = _compile_keyword_matcher(all_keywords)
+    prefiltered_noise_count = 0
+    for handle, tweets in tweets_by_figure.items():
+        kept = [t for t in tweets if matches_location(t.get('text', ''))]
+        prefiltered_noise_count += len(tweets) - len(kept)
+        tweets_by_figure[handle] = kept
+
+    if prefiltered_noise_count:
+        print(f"🧹 Pre-filtered {prefiltered_noise_count} tweets with no location mention (tagged NOISE locally)")
+
     if total_tweets_fetched == 0:
         print("⚠️  No tweets fetched. Returning empty result.")
         return {
@@ -300,113 +447,180 @@ async def analyze_tweets_for_event(
         }
     
     
-    # Build system prompt
-    system_prompt = ANALYSIS_SYSTEM_PROMPT.format(
+    # Build system prompt (static prefix cached provider-side; see _call_grok)
+    system_prompt = _SYSTEM_PROMPT_STATIC_PREFIX + ANALYSIS_SYSTEM_PROMPT.format(
         event_description=event_description,
         location=location,
-        location_variants=", ".join(location_variants),
-        ruling_criteria=json.dumps(RULING_CRITERIA, indent=2)
+        location_variants=", ".join(location_variants)
     )
-    
-    # Build user prompt with REAL fetched tweets
-    user_prompt = f"""
-Analyze the following REAL tweets fetched from X API for the prediction event:
+
+    # Shared boilerplate (task + flat per-figure schema), identical across
+    # figure calls so it can be cached provider-side as a second segment.
+    user_prompt_prefix = f"""
+Analyze the REAL tweets fetched from X API (listed after this block) for the prediction event:
 "{event_description}"
 
-Period: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}
 Deadline: {deadline}
-Total tweets fetched: {total_tweets_fetched}
-
-TWEETS BY FIGURE:
-"""
-    
-    # Add real tweets for each figure
-    for figure in figures:
-        handle = figure.get('x_handle', '')
-        lookup_handle = f"@{handle.replace('@', '')}"
-        name = figure.get('name', 'Unknown')
-        tweets = tweets_by_figure.get(lookup_handle, [])
-        
-        user_prompt += f"\n--- {name} ({handle}) - {len(tweets)} tweets ---\n"
-        
-        if tweets:
-            for j, tweet in enumerate(tweets, 1):
-                text = tweet.get('text', '')[:500]  # Truncate long tweets
-                user_prompt += f"\n[{j}] ID: {tweet['id']}\n"
-                user_prompt += f"    Date: {tweet['created_at']}\n"
-                user_prompt += f"    Text: {text}\n"
-        else:
-            user_prompt += "No tweets in period.\n"
-    
-    user_prompt += f"""
+Period: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}
 
----
-TASK: For each tweet above:
+TASK: For each tweet:
 1. Check if it mentions {location} or related topics
 2. Classify as ALPHA (prediction/analysis) or NOISE (superficial)
 3. Extract sentiment: Bullish (favors capture), Bearish (favors defense), Neutral
 4. Assign confidence 0-1
 
-Return JSON:
+Return JSON for this single figure:
 {{
-  "prediction_event": "{event_description}",
-  "analysis_period": "{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}",
-  "summary": {{
-    "total_tweets_analyzed": {total_tweets_fetched},
-    "total_relevant_tweets": 0,
-    "alpha_count": 0,
-    "noise_count": 0,
-    "sentiment_trend": "",
-    "key_insights": []
-  }},
-  "findings_by_figure": [
+  "name": "",
+  "handle": "",
+  "total_tweets_retrieved": 0,
+  "relevant_tweets": 0,
+  "alpha_count": 0,
+  "noise_count": 0,
+  "sentiment_overall": "",
+  "notes": [],
+  "tweets": [
     {{
-      "name": "",
-      "handle": "",
-      "total_tweets_retrieved": 0,
-      "relevant_tweets": 0,
-      "alpha_count": 0,
-      "noise_count": 0,
-      "sentiment_overall": "",
-      "notes": [],
-      "tweets": [
-        {{
-          "tweet_id": "",
-          "date": "",
-          "summary": "",
-          "classification": "ALPHA|NOISE",
-          "confidence": 0.0,
-          "sentiment": "",
-          "notes": ""
-        }}
-      ]
+      "tweet_id": "",
+      "date": "",
+      "summary": "",
+      "classification": "ALPHA|NOISE",
+      "confidence": 0.0,
+      "sentiment": "",
+      "notes": ""
     }}
-  ],
-  "ruling_criteria_applied": "alpha_signal and noise criteria",
-  "recommendations": []
+  ]
 }}
 """
-    
-    # Call Grok
+
+    # One Grok call per figure, fired concurrently behind a semaphore; the
+    # summary statistics are aggregated in Python instead of asking the LLM
+    # to produce them over one monolithic prompt.
+    figures_with_tweets = []
+    silent_figures = []
+    for figure in figures:
+        lookup_handle = f"@{figure.get('x_handle', '').replace('@', '')}"
+        tweets = tweets_by_figure.get(lookup_handle, [])
+        if tweets:
+            figures_with_tweets.append((figure, lookup_handle, tweets))
+        else:
+            silent_figures.append(lookup_handle)
+
+    if silent_figures:
+        print(f"🤫 {len(silent_figures)} figures with no relevant tweets skipped: {', '.join(silent_figures[:10])}")
+
+    # Nothing survived the pre-filter - skip the Grok stage entirely
+    if not figures_with_tweets:
+        print("⚠️  No relevant tweets after pre-filtering. Skipping Grok analysis.")
+        return {
+            "prediction_event": event_description,
+            "analysis_period": f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}",
+            "summary": {
+                "total_tweets_analyzed": total_tweets_fetched,
+                "alpha_count": 0,
+                "noise_count": prefiltered_noise_count,
+                "prefiltered_noise_count": prefiltered_noise_count
+            },
+            "findings_by_figure": [],
+            "recommendations": ["No location-relevant tweets in period"]
+        }
+
     client = GrokClient()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_ANALYSES)
+
+    # Allow larger completions to avoid truncation; override via GROK_MAX_TOKENS
+    max_tokens = int(os.getenv("GROK_MAX_TOKENS", "16000"))
+
+    async def _analyze_one_figure(figure, lookup_handle, tweets):
+        name = figure.get('name', 'Unknown')
+        # append/join instead of repeated += so prompt build stays O(N)
+        parts = [f"\n--- {name} ({lookup_handle}) - {len(tweets)} tweets ---\n"]
+        for j, tweet in enumerate(tweets, 1):
+            text = tweet.get('text', '')
+            if len(text) > MAX_TWEET_CHARS:
+                text = text[:MAX_TWEET_CHARS - 1] + "…"
+            parts.append(
+                f"\n[{j}] ID: {tweet['id']}\n"
+                f"    Date: {tweet['created_at']}\n"
+                f"    Text: {text}\n"
+            )
+        user_prompt = "".join(parts)
+
+        async with semaphore:
+            finding = await client._call_grok(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                temperature=0.2,
+                max_tokens=max_tokens,
+                expect_json=True,
+                cache_system_prompt=True,
+                cached_user_prefix=user_prompt_prefix
+            )
+
+        # Backstop identity fields so aggregation never depends on the LLM
+        finding["name"] = name
+        finding["handle"] = lookup_handle
+        finding["total_tweets_retrieved"] = len(tweets)
+        return finding
+
     try:
-        print("🤖 Calling Grok-4-1-Fast for tweet analysis...")
+        print(f"🤖 Calling Grok-4-1-Fast for tweet analysis ({len(figures_with_tweets)} figures, max {MAX_CONCURRENT_ANALYSES} concurrent)...")
         print()
-        
-        # Allow larger completions to avoid truncation; override via GROK_MAX_TOKENS
-        max_tokens = int(os.getenv("GROK_MAX_TOKENS", "16000"))
-        
-        response = await client._call_grok(
-            system_prompt=system_prompt,
-            user_prompt=user_prompt,
-            temperature=0.2,
-            max_tokens=max_tokens,
-            expect_json=True
+
+        figure_results = await asyncio.gather(
+            *(_analyze_one_figure(f, h, t) for f, h, t in figures_with_tweets),
+            return_exceptions=True
         )
     finally:
         await client.close()
-    
-    return response
+
+    # Aggregate per-figure findings into the original response shape
+    findings_by_figure = []
+    for (figure, lookup_handle, _tweets), result in zip(figures_with_tweets, figure_results):
+        if isinstance(result, Exception):
+            print(f"⚠️  Analysis failed for {lookup_handle}: {str(result)[:80]}")
+            continue
+        findings_by_figure.append(result)
+
+    alpha_count = 0
+    noise_count = prefiltered_noise_count
+    relevant_count = 0
+    sentiment_counts = {"bullish": 0, "bearish": 0, "neutral": 0}
+    key_insights = []
+
+    for finding in findings_by_figure:
+        for tweet in finding.get("tweets", []):
+            if tweet.get("classification") == "ALPHA":
+                alpha_count += 1
+            else:
+                noise_count += 1
+            sentiment = str(tweet.get("sentiment", "")).lower()
+            if sentiment in sentiment_counts:
+                sentiment_counts[sentiment] += 1
+        relevant_count += finding.get("relevant_tweets", 0) or 0
+        key_insights.extend(finding.get("notes", []))
+
+    if sentiment_counts["bullish"] or sentiment_counts["bearish"]:
+        sentiment_trend = max(sentiment_counts, key=sentiment_counts.get)
+    else:
+        sentiment_trend = "neutral"
+
+    return {
+        "prediction_event": event_description,
+        "analysis_period": f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}",
+        "summary": {
+            "total_tweets_analyzed": total_tweets_fetched,
+            "total_relevant_tweets": relevant_count,
+            "alpha_count": alpha_count,
+            "noise_count": noise_count,
+            "prefiltered_noise_count": prefiltered_noise_count,
+            "sentiment_trend": sentiment_trend,
+            "key_insights": key_insights[:10]
+        },
+        "findings_by_figure": findings_by_figure,
+        "ruling_criteria_applied": "alpha_signal and noise criteria",
+        "recommendations": []
+    }
 
 
 def analyze_tweets_for_event_sync(
@@ -459,20 +673,19 @@ def print_analysis_summary(results: Dict[str, Any]):
     
     # Top alpha signals
     print("TOP ALPHA SIGNALS:")
-    alpha_tweets = []
-    for figure in results.get('findings_by_figure', []):
-        for tweet in figure.get('tweets', []):
-            if tweet.get('classification') == 'ALPHA':
-                alpha_tweets.append({
-                    'figure': figure['name'],
-                    'handle': figure['handle'],
-                    'tweet': tweet
-                })
-    
-    # Sort by confidence
-    alpha_tweets.sort(key=lambda x: x['tweet'].get('confidence', 0), reverse=True)
-    
-    for i, item in enumerate(alpha_tweets[:10], 1):
+    alpha_tweets = [
+        {'figure': figure['name'], 'handle': figure['handle'], 'tweet': tweet}
+        for figure in results.get('findings_by_figure', [])
+        for tweet in figure.get('tweets', [])
+        if tweet.get('classification') == 'ALPHA'
+    ]
+
+    # Top 10 by confidence - partial selection, no full sort
+    top_alpha = heapq.nlargest(
+        10, alpha_tweets, key=lambda x: x['tweet'].get('confidence', 0)
+    )
+
+    for i, item in enumerate(top_alpha, 1):
         tweet = item['tweet']
         print(f"\n{i}. {item['figure']} ({item['handle']})")
         print(f"   Date: {tweet.get('date')}")
@@ -568,7 +781,7 @@ if __name__ == "__main__":
         output_file = figures_file.replace("prominent_figures_", "tweet_analysis_")
         
         with open(output_file, "w") as f:
-            json.dump(results, f, indent=2, default=str)
+            f.write(_dumps_indented(results))
         
         print(f"💾 Saved analysis to: {output_file}")
         
@@ -1,9 +1,14 @@
+import functools
 import os
 from xdk import Client
 
+@functools.lru_cache(maxsize=4)
 def get_client(auth_type='bearer'):
     """
     Returns an XDK Client instance based on the requested authentication type.
+
+    Memoized so repeat callers share one client (and its HTTP connection
+    pool / TLS state) instead of re-doing setup per call.
     """
     if auth_type == 'bearer':
         bearer_token = os.getenv("X_BEARER_TOKEN")
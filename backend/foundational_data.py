@@ -5,13 +5,20 @@ Generates comprehensive event data (Facts, Odds, Arbitrage, Charts)
 using the xAI SDK with agentic tools (Web Search, X Search).
 """
 
+import hashlib
 import json
+import logging
 import os
+import random
+import re
+import sys
+import threading
+import time
 import asyncio
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from pathlib import Path
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 # Load .env file
 try:
@@ -21,6 +28,20 @@ try:
 except ImportError:
     pass
 
+# orjson for JSON-encoding hot paths (~5-10x stdlib, native datetime);
+# stdlib fallback keeps the module importable without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Tolerant partial-JSON parser for incremental decoding of the response
+# while it is still streaming (pydantic-core >= 2.x)
+try:
+    from pydantic_core import from_json as _partial_from_json
+except ImportError:
+    _partial_from_json = None
+
 # xAI SDK Imports
 try:
     from xai_sdk import Client
@@ -30,6 +51,9 @@ except ImportError:
     raise ImportError("Please install xai_sdk: pip install xai-sdk")
 
 
+logger = logging.getLogger(__name__)
+
+
 # --- Data Models ---
 
 class MarketOdds(BaseModel):
@@ -61,6 +85,15 @@ class ChartDataset(BaseModel):
     borderColor: Optional[List[str]] = None
     borderWidth: Optional[int] = 1
 
+    @field_validator("backgroundColor", "borderColor")
+    @classmethod
+    def _intern_colors(cls, colors: Optional[List[str]]) -> Optional[List[str]]:
+        # Color strings repeat heavily across slices/datasets; interning
+        # collapses the duplicates to shared objects
+        if colors is None:
+            return None
+        return [sys.intern(c) for c in colors]
+
 
 class ChartData(BaseModel):
     """Chart.js data structure"""
@@ -93,6 +126,77 @@ class FoundationalData(BaseModel):
     sources: List[str] = Field(default_factory=list, description="List of X post URLs used as sources")
 
 
+def _validate_foundational_json(
+    clean_text: str,
+    event_query: str,
+    citations: List[str]
+) -> FoundationalData:
+    """
+    Validate LLM output in a single parse+validate pass (Pydantic v2's jiter
+    path). Only falls back to a two-stage dict parse when missing fields
+    (generated_at / event_query / sources) need backfilling.
+    """
+    try:
+        data = FoundationalData.model_validate_json(clean_text)
+    except Exception:
+        response_dict = json.loads(clean_text)
+        if not response_dict.get("generated_at"):
+            response_dict["generated_at"] = datetime.now().isoformat()
+        if not response_dict.get("event_query"):
+            response_dict["event_query"] = event_query
+        if not response_dict.get("sources") and citations:
+            response_dict["sources"] = citations
+        return FoundationalData.model_validate(response_dict)
+
+    # sources defaults to [] so a clean first-pass parse still needs the
+    # citation backfill; one model_copy keeps it a single jiter pass
+    if not data.sources and citations:
+        data = data.model_copy(update={"sources": citations})
+    return data
+
+
+# Fenced JSON payload, or a bare outermost object embedded in prose,
+# captured in a single linear scan
+_JSON_EXTRACT = re.compile(r"```(?:json)?\s*(.*?)\s*```|(\{.*\})", re.S)
+
+
+def _parse_final(
+    response_text,
+    citations: List[str],
+    event_query: str
+) -> FoundationalData:
+    """
+    Clean up and validate a complete agentic-search response.
+
+    Pure CPU-bound function (no awaits) so async callers can push the
+    multi-KB cleanup + validation off the event loop with asyncio.to_thread.
+    """
+    if isinstance(response_text, str):
+        clean_text = response_text.strip()
+
+        try:
+            return _validate_foundational_json(clean_text, event_query, citations)
+        except (json.JSONDecodeError, ValueError):
+            # Fallback: pull the fenced payload or bare JSON object out of
+            # surrounding prose with one regex scan
+            match = _JSON_EXTRACT.search(clean_text)
+            if match:
+                return _validate_foundational_json(
+                    match.group(1) or match.group(2), event_query, citations
+                )
+            raise ValueError(f"Could not parse JSON from response: {response_text[:100]}...")
+
+    # Defensive: SDK already returned a parsed dict
+    response_dict = dict(response_text)
+    if not response_dict.get("generated_at"):
+        response_dict["generated_at"] = datetime.now().isoformat()
+    if not response_dict.get("event_query"):
+        response_dict["event_query"] = event_query
+    if not response_dict.get("sources") and citations:
+        response_dict["sources"] = citations
+    return FoundationalData.model_validate(response_dict)
+
+
 # --- Service ---
 
 FOUNDATIONAL_SYSTEM_PROMPT = """You are a prediction market data aggregator and analyst. 
@@ -115,6 +219,66 @@ If you cannot access live real-time data, provide the most accurate estimate bas
 IMPORTANT: Search for the Polymarket URL if provided to read user comments and positions on the market."""
 
 
+# Schema generation walks the whole model graph and its output never
+# changes, so compute it once at import. It is enforced server-side via
+# constrained decoding (response_format) rather than pasted into the prompt,
+# which saves thousands of input tokens per call and guarantees well-formed
+# output. The invariant prompt body is a module constant too - per call only
+# the event query gets interpolated.
+_RESPONSE_SCHEMA = FoundationalData.model_json_schema()
+
+_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "FoundationalData",
+        "schema": _RESPONSE_SCHEMA,
+        "strict": True,
+    },
+}
+
+_PROMPT_BODY = """
+Use your 'web_search' and 'x_search' tools to find the latest real-time information, news, and odds.
+Research the current status, recent developments, and market sentiment.
+
+After gathering information, provide a comprehensive FoundationalData object.
+
+REQUIREMENTS:
+1. facts_summary: Concise, neutral, up-to-date summary based on your research.
+2. current_odds: Estimate current odds from your search results.
+3. arbitrage_opportunities: Look for spreads.
+4. probability_visualization: Create a 'pie' chart.
+5. sources: List the URLs of the sources you found.
+"""
+
+
+def _build_prompt(event_query: str) -> str:
+    """Assemble the agentic-search user prompt for an event query."""
+    return f'\nAnalyze this prediction event: "{event_query}"\n' + _PROMPT_BODY
+
+
+# --- Response cache ---
+# Each agentic search is a multi-second Grok stream with tool calls; repeat
+# queries for the same event within the TTL are served from memory instead.
+
+_CACHE_TTL_SECONDS = 300.0
+_CACHE_MAX_ENTRIES = 64
+
+# Batch fan-out retry policy (jittered exponential backoff on 429/503)
+_BATCH_MAX_ATTEMPTS = 8
+_BATCH_BACKOFF_BASE = 1.0
+_BATCH_BACKOFF_CAP = 30.0
+_response_cache: Dict[str, tuple] = {}
+# threading.Lock (not asyncio): the guarded sections never await, and a
+# plain lock works from every event loop and the sync wrappers alike
+_response_cache_lock = threading.Lock()
+
+
+def _cache_key(event_query: str) -> str:
+    """Normalized cache key so trivial casing/whitespace variants hit."""
+    normalized = event_query.strip().lower().encode()
+    return hashlib.blake2b(normalized, digest_size=16).hexdigest()
+
+
 # --- Singleton xAI Client ---
 # The xAI Client is just an interface - it doesn't hold conversation state.
 # Each chat.create() call creates a new conversation context.
@@ -122,34 +286,54 @@ IMPORTANT: Search for the Polymarket URL if provided to read user comments and p
 
 _xai_client: Optional[Client] = None
 _xai_client_api_key: Optional[str] = None
+_xai_client_lock = threading.Lock()
 
 
-def _get_xai_client(api_key: Optional[str] = None) -> Client:
-    """Get or create singleton xAI Client. Thread-safe lazy initialization."""
-    global _xai_client, _xai_client_api_key
-    
+def _resolve_api_key(api_key: Optional[str] = None) -> str:
+    """Resolve the xAI API key from the argument or environment, once."""
     resolved_key = api_key or os.getenv("GROK_API_KEY") or os.getenv("XAI_API_KEY")
     if not resolved_key:
         raise ValueError("GROK_API_KEY or XAI_API_KEY not found in environment variables")
-    
-    # Reinitialize if API key changed
+    return resolved_key
+
+
+def _get_xai_client(api_key: Optional[str] = None) -> Client:
+    """Get or create singleton xAI Client. Thread-safe lazy initialization."""
+    global _xai_client, _xai_client_api_key
+
+    resolved_key = _resolve_api_key(api_key)
+
+    # Fast path without the lock; recheck under it so two threads racing
+    # through the None check can't both pay a full client init
     if _xai_client is None or _xai_client_api_key != resolved_key:
-        print("🔧 Initializing xAI SDK Client (singleton)...")
-        _xai_client = Client(api_key=resolved_key)
-        _xai_client_api_key = resolved_key
-        print("✅ xAI Client ready")
-    
+        with _xai_client_lock:
+            if _xai_client is None or _xai_client_api_key != resolved_key:
+                print("🔧 Initializing xAI SDK Client (singleton)...")
+                _xai_client = Client(api_key=resolved_key)
+                _xai_client_api_key = resolved_key
+                print("✅ xAI Client ready")
+
     return _xai_client
 
 
+# Pre-warm at import when credentials are already configured, moving client
+# setup out of the first request's critical path
+if os.getenv("GROK_API_KEY") or os.getenv("XAI_API_KEY"):
+    try:
+        _get_xai_client()
+    except Exception:
+        # Defer errors (bad key etc.) to the first real request
+        pass
+
+
 class FoundationalDataService:
     """Service to generate foundational data for events using xAI SDK"""
 
     def __init__(self, api_key: Optional[str] = None):
-        self.api_key = api_key or os.getenv("GROK_API_KEY") or os.getenv("XAI_API_KEY")
-        if not self.api_key:
-            raise ValueError("GROK_API_KEY or XAI_API_KEY not found in environment variables")
-        
+        # Resolve the key once; passing it down means the singleton helper's
+        # short-circuit skips the duplicate env lookups
+        self.api_key = _resolve_api_key(api_key)
+
         # Use singleton xAI Client (avoids reinitializing on every call)
         self.client = _get_xai_client(self.api_key)
 
@@ -163,81 +347,127 @@ class FoundationalDataService:
         """
         Generate full foundational data for an event query using xAI Agentic Tools.
         """
+        cache_key = _cache_key(event_query)
+        with _response_cache_lock:
+            cached = _response_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < _CACHE_TTL_SECONDS:
+                print(f"⚡ Foundational cache hit for: '{event_query}'")
+                return cached[1]
+
         print(f"📊 Generating foundational data for: '{event_query}'")
-        
-        schema = FoundationalData.model_json_schema()
-        
-        user_prompt = f"""
-Analyze this prediction event: "{event_query}"
 
-Use your 'web_search' and 'x_search' tools to find the latest real-time information, news, and odds.
-Research the current status, recent developments, and market sentiment.
+        # Consume the live event bridge; only the final result matters here
+        data = None
+        async for event in self.stream_events(event_query):
+            if event.get("type") == "result":
+                data = event["data"]
+        if data is None:
+            raise ValueError(f"Agentic search produced no result for: '{event_query}'")
 
-After gathering information, provide a comprehensive data object matching the following JSON schema.
+        with _response_cache_lock:
+            if len(_response_cache) >= _CACHE_MAX_ENTRIES:
+                # Evict the stalest entry to keep the cache bounded
+                oldest = min(_response_cache, key=lambda k: _response_cache[k][0])
+                del _response_cache[oldest]
+            _response_cache[cache_key] = (time.monotonic(), data)
 
-REQUIREMENTS:
-1. facts_summary: Concise, neutral, up-to-date summary based on your research.
-2. current_odds: Estimate current odds from your search results.
-3. arbitrage_opportunities: Look for spreads.
-4. probability_visualization: Create a 'pie' chart.
-5. sources: List the URLs of the sources you found.
+        return data
 
-JSON SCHEMA:
-{json.dumps(schema, indent=2)}
+    async def stream_events(self, event_query: str):
+        """
+        Async bridge over the sync xAI stream.
 
-Respond with ONLY valid JSON matching this schema. Do not include markdown formatting like ```json.
-"""
+        A worker thread runs _run_agentic_search and pushes each event into
+        an asyncio.Queue via call_soon_threadsafe, so callers (e.g. SSE
+        handlers) see tool calls and progress the moment they happen instead
+        of after the whole stream completes. Ends with
+        {"type": "result", "data": FoundationalData}.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        sentinel = object()
 
-        # Run the synchronous SDK call in a thread to avoid blocking async loop
-        def _consume_search():
-            content = ""
-            cites = []
-            for event in self._run_agentic_search(user_prompt):
-                if event["type"] == "content":
-                    content = event["content"]
-                elif event["type"] == "citations":
-                    cites = event["citations"]
-            return content, cites
+        user_prompt = _build_prompt(event_query)
 
-        response_text, citations = await asyncio.to_thread(_consume_search)
-        
-        # Parse JSON from response
-        if isinstance(response_text, str):
-            # Clean up potential markdown
-            clean_text = response_text.strip()
-            if clean_text.startswith("```json"):
-                clean_text = clean_text.split("```json", 1)[1]
-            if clean_text.endswith("```"):
-                clean_text = clean_text.rsplit("```", 1)[0]
-            clean_text = clean_text.strip()
-            
+        def _produce():
             try:
-                response_dict = json.loads(clean_text)
-            except json.JSONDecodeError:
-                # Fallback: try to find JSON object in text
-                start = clean_text.find("{")
-                end = clean_text.rfind("}") + 1
-                if start >= 0 and end > start:
-                    response_dict = json.loads(clean_text[start:end])
-                else:
-                    raise ValueError(f"Could not parse JSON from response: {response_text[:100]}...")
-        else:
-            response_dict = response_text
+                for event in self._run_agentic_search(user_prompt):
+                    loop.call_soon_threadsafe(queue.put_nowait, event)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, sentinel)
 
-        # Ensure generated_at is set
-        if "generated_at" not in response_dict or not response_dict.get("generated_at"):
-            response_dict["generated_at"] = datetime.now().isoformat()
-            
-        # Ensure event_query is set
-        if "event_query" not in response_dict or not response_dict.get("event_query"):
-            response_dict["event_query"] = event_query
-            
-        # Ensure sources are populated from citations if not in JSON
-        if not response_dict.get("sources") and citations:
-            response_dict["sources"] = citations
+        producer = loop.run_in_executor(None, _produce)
 
-        # Validate and return
-        return FoundationalData.model_validate(response_dict)
+        response_text = ""
+        citations: List[str] = []
+        delta_parts: List[str] = []
+        try:
+            while True:
+                event = await queue.get()
+                if event is sentinel:
+                    break
+                if event["type"] == "content":
+                    response_text = event["content"]
+                elif event["type"] == "citations":
+                    citations = event["citations"]
+                elif event["type"] == "content_delta":
+                    # Opportunistically decode the growing buffer so callers
+                    # can render partial structured output mid-stream; the
+                    # strict validation still happens once at the end.
+                    delta_parts.append(event["delta"])
+                    if _partial_from_json is not None and len(delta_parts) % 8 == 0:
+                        try:
+                            partial = _partial_from_json(
+                                "".join(delta_parts), allow_partial=True
+                            )
+                        except ValueError:
+                            pass
+                        else:
+                            yield {"type": "partial", "data": partial}
+                yield event
+        finally:
+            await producer
+
+        # Cleanup + validation are CPU-bound on multi-KB payloads; run them
+        # in a thread so other coroutines aren't head-of-line blocked.
+        data = await asyncio.to_thread(_parse_final, response_text, citations, event_query)
+        yield {"type": "result", "data": data}
+
+    async def generate_data_batch(
+        self,
+        queries: List[str],
+        max_concurrency: int = 8
+    ) -> List[FoundationalData]:
+        """
+        Fan out multiple event queries concurrently.
+
+        Each agentic search is a multi-second I/O-bound stream, so bounded
+        concurrency gives near-linear throughput. Rate-limit responses
+        (429/503) are retried with jittered exponential backoff.
+
+        Returns results in query order; failed queries raise after retries.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _one(query: str) -> FoundationalData:
+            async with semaphore:
+                last_error = None
+                for attempt in range(_BATCH_MAX_ATTEMPTS):
+                    try:
+                        return await self.generate_data(query)
+                    except Exception as e:
+                        message = str(e)
+                        if "429" not in message and "503" not in message:
+                            raise
+                        last_error = e
+                        # Full-jitter exponential backoff, capped
+                        delay = min(_BATCH_BACKOFF_CAP, _BATCH_BACKOFF_BASE * 2 ** attempt)
+                        delay *= random.uniform(0.5, 1.5)
+                        print(f"⚠️ [Foundational] Rate limited on '{query[:40]}...', retry {attempt + 1}/{_BATCH_MAX_ATTEMPTS} in {delay:.1f}s")
+                        await asyncio.sleep(delay)
+                raise RuntimeError(f"Foundational batch query failed after {_BATCH_MAX_ATTEMPTS} attempts: {last_error}")
+
+        return await asyncio.gather(*(_one(q) for q in queries))
 
     def _run_agentic_search(self, prompt: str, timeout_seconds: int = 180):
         """
@@ -248,8 +478,10 @@ Respond with ONLY valid JSON matching this schema. Do not include markdown forma
             prompt: The search prompt
             timeout_seconds: Maximum time to wait for the stream (default 3 minutes)
         """
-        import time
-        start_time = time.time()
+        # Monotonic ns clock: immune to NTP wall-clock jumps during the
+        # 180s timeout window, and integer comparison in the hot loop
+        start_ns = time.monotonic_ns()
+        timeout_ns = timeout_seconds * 1_000_000_000
         
         print("🤖 [Foundational] Grok Agent Initializing...")
         yield {"type": "log", "message": "🤖 Grok Agent Initializing..."}
@@ -263,6 +495,8 @@ Respond with ONLY valid JSON matching this schema. Do not include markdown forma
                     web_search(),
                     x_search()
                 ],
+                # Constrained decoding: output is schema-valid JSON server-side
+                response_format=_RESPONSE_FORMAT,
             )
             
             # Append messages using SDK helpers
@@ -270,77 +504,96 @@ Respond with ONLY valid JSON matching this schema. Do not include markdown forma
             chat.append(system(FOUNDATIONAL_SYSTEM_PROMPT))
             chat.append(user(prompt))
             
-            final_content = ""
+            content_parts: List[str] = []
             is_thinking = True
             last_response = None
             chunk_count = 0
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            seen_tool_call_ids = set()
             
             print("🚀 [Foundational] Starting stream...")
             yield {"type": "log", "message": "Starting foundational stream..."}
             
             for response, chunk in chat.stream():
                 chunk_count += 1
-                elapsed = time.time() - start_time
-                
+                elapsed_ns = time.monotonic_ns() - start_ns
+
                 # Check timeout
-                if elapsed > timeout_seconds:
-                    print(f"\n⏰ [Foundational] TIMEOUT after {elapsed:.1f}s and {chunk_count} chunks")
+                if elapsed_ns > timeout_ns:
+                    print(f"\n⏰ [Foundational] TIMEOUT after {elapsed_ns / 1e9:.1f}s and {chunk_count} chunks")
                     yield {"type": "error", "error": f"Foundational search timed out after {timeout_seconds}s"}
                     break
                 
                 last_response = response
+
+                # Log progress every 10 chunks (debug only - this is the hot loop)
+                if debug_enabled and chunk_count % 10 == 0:
+                    logger.debug("[Foundational] Progress: %d chunks, %.1fs elapsed", chunk_count, elapsed_ns / 1e9)
                 
-                # Log progress every 10 chunks
-                if chunk_count % 10 == 0:
-                    print(f"📊 [Foundational] Progress: {chunk_count} chunks, {elapsed:.1f}s elapsed")
-                
-                # View the server-side tool calls as they are being made in real-time
+                # View the server-side tool calls as they are being made in
+                # real-time - deduplicated by id (chunks repeat in-flight
+                # calls) and coalesced into one event per chunk
+                new_tool_calls = []
                 for tool_call in chunk.tool_calls:
-                    msg = f"Calling tool: {tool_call.function.name}"
-                    args = tool_call.function.arguments
-                    print(f"\n  > [Foundational] {msg} args={args[:100]}...")
-                    yield {
-                        "type": "tool_call", 
-                        "tool": tool_call.function.name, 
-                        "args": args
-                    }
+                    call_id = getattr(tool_call, "id", None) or (
+                        tool_call.function.name, tool_call.function.arguments
+                    )
+                    if call_id in seen_tool_call_ids:
+                        continue
+                    seen_tool_call_ids.add(call_id)
+                    if debug_enabled:
+                        logger.debug(
+                            "[Foundational] Calling tool: %s args=%.100s",
+                            tool_call.function.name, tool_call.function.arguments
+                        )
+                    new_tool_calls.append({
+                        "tool": tool_call.function.name,
+                        "args": tool_call.function.arguments
+                    })
+                if new_tool_calls:
+                    yield {"type": "tool_calls", "items": new_tool_calls}
                 
                 if response.usage and response.usage.reasoning_tokens and is_thinking:
-                    print(f"\r💭 [Foundational] Thinking... ({response.usage.reasoning_tokens} tokens)", end="", flush=True)
+                    if debug_enabled:
+                        logger.debug("[Foundational] Thinking... (%d tokens)", response.usage.reasoning_tokens)
                     yield {"type": "thinking", "tokens": response.usage.reasoning_tokens}
                 
                 if chunk.content and is_thinking:
+                    elapsed = elapsed_ns / 1e9
                     print(f"\n\n✅ [Foundational] Final Response Generation Started after {elapsed:.1f}s...")
                     yield {"type": "log", "message": f"Final Response Generation Started after {elapsed:.1f}s..."}
                     is_thinking = False
                 
                 if chunk.content and not is_thinking:
-                    final_content += chunk.content
-            
-            elapsed = time.time() - start_time
+                    # append/join: += on a string is quadratic across
+                    # hundreds of stream chunks
+                    content_parts.append(chunk.content)
+                    yield {"type": "content_delta", "delta": chunk.content}
+
+            final_content = "".join(content_parts)
+            elapsed = (time.monotonic_ns() - start_ns) / 1e9
             print(f"\n🏁 [Foundational] Stream complete: {chunk_count} chunks in {elapsed:.1f}s")
             
             if last_response:
-                print("\n📚 [Foundational] Citations:")
-                print(last_response.citations)
+                # The data travels in the yielded events; the repr() prints of
+                # long citation/tool lists are debug-only so the completion
+                # path isn't blocked serializing them
+                logger.debug("[Foundational] Citations: %r", last_response.citations)
                 yield {"type": "citations", "citations": last_response.citations}
-                
-                print("\n📈 [Foundational] Usage:")
-                print(last_response.usage)
+
+                logger.debug("[Foundational] Usage: %r", last_response.usage)
                 yield {"type": "usage", "usage": last_response.usage}
-                
-                print(f"\n🛠️ [Foundational] Server Side Tool Usage:")
-                print(last_response.server_side_tool_usage)
-                print(f"\n🛠️ [Foundational] Tool Calls:")
-                print(last_response.tool_calls)
-                
+
+                logger.debug("[Foundational] Server side tool usage: %r", last_response.server_side_tool_usage)
+                logger.debug("[Foundational] Tool calls: %r", last_response.tool_calls)
+
                 yield {"type": "content", "content": final_content}
                 return
             
             yield {"type": "content", "content": final_content}
             
         except Exception as e:
-            elapsed = time.time() - start_time
+            elapsed = (time.monotonic_ns() - start_ns) / 1e9
             print(f"\n❌ [Foundational] ERROR after {elapsed:.1f}s: {e}")
             import traceback
             traceback.print_exc()
@@ -363,29 +616,9 @@ def stream_foundational_data_sync(event_query: str):
     Yields: dict (event) or FoundationalData (final result)
     """
     service = FoundationalDataService()
-    
-    # We need to reconstruct the prompt logic here to stream it
-    schema = FoundationalData.model_json_schema()
-    user_prompt = f"""
-Analyze this prediction event: "{event_query}"
 
-Use your 'web_search' and 'x_search' tools to find the latest real-time information, news, and odds.
-Research the current status, recent developments, and market sentiment.
-
-After gathering information, provide a comprehensive data object matching the following JSON schema.
-
-REQUIREMENTS:
-1. facts_summary: Concise, neutral, up-to-date summary based on your research.
-2. current_odds: Estimate current odds from your search results.
-3. arbitrage_opportunities: Look for spreads.
-4. probability_visualization: Create a 'pie' chart.
-5. sources: List the URLs of the sources you found.
-
-JSON SCHEMA:
-{json.dumps(schema, indent=2)}
-
-Respond with ONLY valid JSON matching this schema. Do not include markdown formatting like ```json.
-"""
+    # Same prompt as generate_data
+    user_prompt = _build_prompt(event_query)
 
     # Run the generator
     # Since the SDK is sync, we can just iterate directly
@@ -400,38 +633,15 @@ Respond with ONLY valid JSON matching this schema. Do not include markdown forma
         
         yield event
 
-    # Parse JSON (same logic as generate_data)
-    if isinstance(response_text, str):
-        clean_text = response_text.strip()
-        if clean_text.startswith("```json"):
-            clean_text = clean_text.split("```json", 1)[1]
-        if clean_text.endswith("```"):
-            clean_text = clean_text.rsplit("```", 1)[0]
-        clean_text = clean_text.strip()
-        
-        try:
-            response_dict = json.loads(clean_text)
-        except json.JSONDecodeError:
-            start = clean_text.find("{")
-            end = clean_text.rfind("}") + 1
-            if start >= 0 and end > start:
-                response_dict = json.loads(clean_text[start:end])
-            else:
-                yield {"type": "error", "message": f"Could not parse JSON: {response_text[:100]}..."}
-                return
-    else:
-        response_dict = response_text
-
-    # Ensure fields
-    if "generated_at" not in response_dict or not response_dict.get("generated_at"):
-        response_dict["generated_at"] = datetime.now().isoformat()
-    if "event_query" not in response_dict or not response_dict.get("event_query"):
-        response_dict["event_query"] = event_query
-    if not response_dict.get("sources") and citations:
-        response_dict["sources"] = citations
+    # Parse via the shared helper (same logic as generate_data)
+    try:
+        data = _parse_final(response_text, citations, event_query)
+    except (json.JSONDecodeError, ValueError):
+        yield {"type": "error", "message": f"Could not parse JSON: {str(response_text)[:100]}..."}
+        return
 
     # Yield final object
-    yield FoundationalData.model_validate(response_dict)
+    yield data
 
 
 if __name__ == "__main__":
@@ -441,12 +651,17 @@ if __name__ == "__main__":
     
     try:
         data = get_foundational_data_sync(query)
+        payload = data.model_dump()
+        if orjson is not None:
+            rendered = orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()
+        else:
+            rendered = json.dumps(payload, indent=2, default=str)
         print("\n✅ Data Generated Successfully!")
-        print(json.dumps(data.model_dump(), indent=2, default=str))
-        
+        print(rendered)
+
         # Save to file
         with open("foundational_data_demo.json", "w") as f:
-            json.dump(data.model_dump(), f, indent=2, default=str)
+            f.write(rendered)
         print("\n💾 Saved to foundational_data_demo.json")
         
     except Exception as e:
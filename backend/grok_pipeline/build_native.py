@@ -0,0 +1,28 @@
+"""
+Ahead-of-time build for the trend kernel.
+
+First-call JIT compilation (and even numba's on-disk cache load) costs
+hundreds of milliseconds per worker boot. Compiling the kernel to a
+shared object once at build time removes LLVM from the cold-start path
+entirely; schemas._trend_kernel picks the native module up automatically
+when present.
+
+Usage:
+    python -m grok_pipeline.build_native
+
+Produces _trend_native.<abi>.so next to this module.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from .schemas import _trend_kernel_impl
+
+cc = CC("_trend_native")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+cc.export("trend_i4", "i4(f4[:])")(_trend_kernel_impl)
+
+
+if __name__ == "__main__":
+    cc.compile()
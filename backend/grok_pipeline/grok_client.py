@@ -4,30 +4,177 @@ Handles communication with Grok API for filter selection and signal analysis.
 """
 
 import asyncio
+import concurrent.futures
+import gzip
+import hashlib
 import json
 import os
+import random
+import re
+import socket
+import threading
+import time
+import weakref
+from collections import OrderedDict, namedtuple
 from typing import Any, Dict, Optional, List, Union
 
 import httpx
 from httpx import AsyncClient as HttpxAsyncClient
 
+# Encode request bodies ourselves (orjson when available) instead of going
+# through httpx's stdlib-json path on every call
+try:
+    import orjson
+
+    def _encode_payload(payload: dict) -> bytes:
+        return orjson.dumps(payload)
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing
+    # error handling is unaffected
+    _loads = orjson.loads
+except ImportError:
+    def _encode_payload(payload: dict) -> bytes:
+        return json.dumps(payload).encode()
+
+    _loads = json.loads
+
 from .schemas import (
     FilterSelectionResponse,
     SignalAnalysisResponse,
     FILTER_SELECTION_SYSTEM_PROMPT,
     SIGNAL_ANALYSIS_SYSTEM_PROMPT
 )
+from .semantic_cache import SemanticCache
 
 
 DEFAULT_MODEL = "grok-4-latest"
 DEFAULT_BASE_URL = "https://api.x.ai"
 DEFAULT_TIMEOUT = 60.0
 
+# --- Response cache ---
+# Byte-identical prompts recur constantly during replays, retries and dev
+# iteration. Cache deterministic JSON responses (low temperature only) at
+# module level so the cache survives the short-lived GrokClient instances
+# some callers construct per request.
+RESPONSE_CACHE_MAX_ENTRIES = 512
+RESPONSE_CACHE_TTL = 3600.0
+CACHEABLE_TEMPERATURE = 0.3
+
+# "Full jitter" backoff (AWS formula): randomized delays stop concurrent
+# callers from retrying in lockstep during transient outages
+RETRY_BACKOFF_BASE = 0.25
+RETRY_BACKOFF_CAP = 10.0
+
+# Compress request bodies above this size; level 1 costs ~nothing CPU-wise
+# and English tweet prompts compress 4-6x
+GZIP_THRESHOLD_BYTES = 4096
+
+def _per_loop(factory):
+    """
+    One asyncio primitive instance per running event loop.
+
+    Module-level primitives bind to the first loop that awaits them and
+    raise "bound to a different event loop" from any other - and this
+    process routinely has several loops (the sync wrappers' background
+    loop, per-asyncio.run loops, a server loop).
+    """
+    instances: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+    def get():
+        loop = asyncio.get_running_loop()
+        instance = instances.get(loop)
+        if instance is None:
+            instance = factory()
+            instances[loop] = instance
+        return instance
+
+    return get
+
+
+# Client-side backpressure: bound concurrent POSTs to api.x.ai so bursty
+# pipelines throttle here instead of triggering 429 storms server-side
+# (per-loop: the bound applies within each event loop)
+_get_grok_semaphore = _per_loop(
+    lambda: asyncio.Semaphore(int(os.getenv("GROK_MAX_CONCURRENCY", "8")))
+)
+
+# Transient statuses worth retrying with backoff
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Fenced payload (closing fence optional for truncated responses),
+# compiled once for the parse fallback path
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)(?:```|$)", re.DOTALL)
+
+
+def _retry_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff delay for the given attempt."""
+    return random.uniform(0, min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * (2 ** attempt)))
+
+_response_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+# Lightweight view of the tweet fields used in prompt formatting
+_TweetView = namedtuple("_TweetView", "username verified text")
+
+# Near-duplicate tweet batches for the same event reuse the previous
+# analysis (embedding similarity when available, exact digest otherwise)
+_semantic_cache = SemanticCache()
+
+
+def _response_cache_key(
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float,
+    tools: Optional[List[Dict[str, Any]]],
+    cached_user_prefix: Optional[str]
+) -> str:
+    """Content hash over everything that influences the completion."""
+    key_material = json.dumps(
+        {
+            "model": model,
+            "system": system_prompt,
+            "user": user_prompt,
+            "user_prefix": cached_user_prefix,
+            "temp": temperature,
+            "tools": tools,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(key_material.encode()).hexdigest()
+
 
 # --- Singleton httpx.AsyncClient ---
 # Reuse connection pool across GrokClient instances for better performance
 _shared_http_client: Optional[httpx.AsyncClient] = None
 _shared_http_api_key: Optional[str] = None
+_get_shared_http_lock = _per_loop(asyncio.Lock)
+
+
+async def _ensure_shared_http_client(api_key: str) -> httpx.AsyncClient:
+    """
+    Async-safe accessor for the shared client.
+
+    Double-checked lock: without it, two coroutines racing through startup
+    would both construct a client and the loser's socket pool would leak.
+    """
+    if (_shared_http_client is None or
+        _shared_http_api_key != api_key or
+        _shared_http_client.is_closed):
+        async with _get_shared_http_lock():
+            return _get_shared_http_client(api_key)
+    return _shared_http_client
+
+
+_GROK_HOST = "api.x.ai"
+
+
+def _prewarm_dns():
+    """Resolve the API host once so resolver caches are hot before use."""
+    try:
+        socket.getaddrinfo(_GROK_HOST, 443, type=socket.SOCK_STREAM)
+    except OSError:
+        pass
 
 
 def _get_shared_http_client(api_key: str) -> httpx.AsyncClient:
@@ -35,21 +182,71 @@ def _get_shared_http_client(api_key: str) -> httpx.AsyncClient:
     global _shared_http_client, _shared_http_api_key
     
     # Reinitialize if API key changed or client is closed
-    if (_shared_http_client is None or 
-        _shared_http_api_key != api_key or 
+    if (_shared_http_client is None or
+        _shared_http_api_key != api_key or
         _shared_http_client.is_closed):
         print("🔧 Initializing shared httpx.AsyncClient (singleton)...")
-        _shared_http_client = httpx.AsyncClient(
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-            timeout=DEFAULT_TIMEOUT,
-            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+        # Generous pool + long keepalive: at high concurrency the old
+        # 10/20 limits saturated and fresh TLS handshakes dominated
+        # latency. Overridable via env for deployment tuning.
+        limits = httpx.Limits(
+            max_keepalive_connections=int(os.getenv("GROK_POOL_KEEPALIVE", "100")),
+            max_connections=int(os.getenv("GROK_POOL_MAX", "200")),
+            # 120s default keeps sockets warm across the idle gaps between
+            # research phases (question fan-out -> deep dive -> synthesis)
+            keepalive_expiry=float(os.getenv("GROK_KEEPALIVE_S", "120.0")),
         )
+        # Bounded connect phase + no proxy-env scan per request
+        timeout = httpx.Timeout(DEFAULT_TIMEOUT, connect=10.0)
+        # HTTP/2 multiplexes concurrent analyses over one TLS stream when
+        # the h2 extra is installed; silently fall back to HTTP/1.1
+        try:
+            _shared_http_client = httpx.AsyncClient(
+                headers={
+                    "Authorization": f"Bearer {api_key}",
+                    "Content-Type": "application/json",
+                },
+                timeout=timeout,
+                limits=limits,
+                http2=True,
+                trust_env=False,
+            )
+        except ImportError:
+            _shared_http_client = httpx.AsyncClient(
+                headers={
+                    "Authorization": f"Bearer {api_key}",
+                    "Content-Type": "application/json",
+                },
+                timeout=timeout,
+                limits=limits,
+                trust_env=False,
+            )
         _shared_http_api_key = api_key
         print("✅ Shared HTTP client ready")
-    
+
+        # Prime DNS off-thread: without this, a burst of first connections
+        # all serializes through a cold getaddrinfo in the default executor
+        threading.Thread(target=_prewarm_dns, name="grok-dns-prewarm", daemon=True).start()
+
+        # Optional warmup: prime TCP+TLS so the first real call skips the
+        # ~300-500ms handshake. Fire-and-forget, opt-in via GROK_WARMUP=1.
+        if os.getenv("GROK_WARMUP") == "1":
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+            if loop is not None:
+                client = _shared_http_client
+
+                async def _warmup():
+                    try:
+                        await client.get(f"{DEFAULT_BASE_URL}/v1/models")
+                    except Exception:
+                        # Any response (even 4xx) already primed the connection
+                        pass
+
+                loop.create_task(_warmup())
+
     return _shared_http_client
 
 
@@ -84,10 +281,14 @@ class GrokClient:
         self.timeout = timeout
         self._use_shared_client = use_shared_client
         self._owns_client = False
+        # Single-flight map: concurrent identical filter selections share
+        # one in-flight API call (see select_filters)
+        self._inflight_filters: Dict[str, asyncio.Future] = {}
         
         if use_shared_client:
-            # Use shared singleton client (better performance, connection reuse)
-            self.client = _get_shared_http_client(self.api_key)
+            # Shared singleton client, bound lazily on first call under an
+            # asyncio.Lock (see _ensure_client) to avoid double-init races
+            self.client = None
         else:
             # Create dedicated client (for isolation if needed)
             self.client = httpx.AsyncClient(
@@ -99,6 +300,12 @@ class GrokClient:
             )
             self._owns_client = True
 
+    async def _ensure_client(self) -> httpx.AsyncClient:
+        """Resolve the HTTP client, lazily binding the shared singleton."""
+        if self.client is None:
+            self.client = await _ensure_shared_http_client(self.api_key)
+        return self.client
+
     async def select_filters(
         self,
         event_id: str,
@@ -116,24 +323,57 @@ class GrokClient:
         Returns:
             FilterSelectionResponse with recommended filters
         """
+        # Single-flight: followers for the same event await the leader's call
+        inflight = self._inflight_filters.get(event_id)
+        if inflight is not None:
+            return await inflight
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._inflight_filters[event_id] = future
+        try:
+            result = await self._select_filters_uncoalesced(
+                event_id, event_description, prediction_markets
+            )
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved for the no-follower case
+            raise
+        finally:
+            # Leader cancellation (CancelledError is a BaseException) would
+            # otherwise leave followers awaiting a forever-pending future
+            if not future.done():
+                future.cancel()
+            self._inflight_filters.pop(event_id, None)
+
+    async def _select_filters_uncoalesced(
+        self,
+        event_id: str,
+        event_description: str,
+        prediction_markets: Optional[list] = None
+    ) -> FilterSelectionResponse:
+        """Issue the actual filter-selection call (no coalescing)."""
         markets_context = ""
         if prediction_markets:
             markets_context = f"\n\nRelevant prediction markets:\n" + "\n".join(prediction_markets)
 
-        user_prompt = f"""
-A new prediction market event has occurred:
+        # Normalized (stripped) so the payload prefix stays byte-stable for
+        # provider-side prefix caching; all variable text sits at the tail
+        user_prompt = f"""A new prediction market event has occurred:
 
 Event ID: {event_id}
 Description: {event_description}
 {markets_context}
 
 Which filters should I apply to detect high-signal tweets about this event?
-Respond with ONLY valid JSON matching the specified schema.
-"""
+Respond with ONLY valid JSON matching the specified schema.""".strip()
 
         response = await self._call_grok(
             system_prompt=FILTER_SELECTION_SYSTEM_PROMPT,
-            user_prompt=user_prompt
+            user_prompt=user_prompt,
+            cache_system_prompt=True
         )
 
         return FilterSelectionResponse.from_dict(response)
@@ -157,15 +397,16 @@ Respond with ONLY valid JSON matching the specified schema.
         Returns:
             SignalAnalysisResponse with quantified metrics
         """
+        # Reuse the previous analysis when this batch is semantically
+        # near-identical to one already answered for this event
+        cached_response = _semantic_cache.get(event_id, tweets)
+        if cached_response is not None:
+            return cached_response
+
         # Format tweets for analysis - limit to top 25 most relevant for consistency
-        tweets_text = "\n\n".join([
-            f"Tweet {i+1} (from @{t.get('author_username', 'unknown')}, "
-            f"verified={t.get('is_verified', False)}):\n{t.get('text', '')}"
-            for i, t in enumerate(tweets[:25])  # Limit to 25 for reliability
-        ])
+        tweets_text = self._format_tweets(tweets)
 
-        user_prompt = f"""
-Analyze the following tweets collected about a prediction market event:
+        user_prompt = f"""Analyze the following tweets collected about a prediction market event:
 
 Event ID: {event_id}
 Filters Applied: {', '.join(filters_used)}
@@ -175,21 +416,117 @@ TWEETS:
 {tweets_text}
 
 Provide a comprehensive signal analysis including sentiment, strength, and market implications.
-Respond with ONLY valid JSON matching the specified schema.
-"""
+Respond with ONLY valid JSON matching the specified schema.""".strip()
 
         for attempt in range(3):
             try:
                 response = await self._call_grok(
                     system_prompt=SIGNAL_ANALYSIS_SYSTEM_PROMPT,
-                    user_prompt=user_prompt
+                    user_prompt=user_prompt,
+                    cache_system_prompt=True
                 )
-                return SignalAnalysisResponse.from_dict(response)
+                result = SignalAnalysisResponse.from_dict(response)
+                _semantic_cache.put(event_id, tweets, result)
+                return result
             except Exception as e:
                 if attempt == 2:  # Last attempt
                     raise
-                # Wait a bit before retry
-                await asyncio.sleep(1)
+                # Jittered wait before retry
+                await asyncio.sleep(_retry_delay(attempt))
+
+    @staticmethod
+    def _format_tweets(tweets: list) -> str:
+        """Render a tweet batch for the analysis prompt (top 25 for reliability)."""
+        # Normalize to lightweight views first so the format loop does a
+        # single f-string per tweet with plain attribute access, then join
+        views = [
+            _TweetView(
+                t.get('author_username', 'unknown'),
+                t.get('is_verified', False),
+                t.get('text', '')
+            )
+            for t in tweets[:25]
+        ]
+        lines = []
+        append = lines.append
+        for i, view in enumerate(views, 1):
+            append(f"Tweet {i} (from @{view.username}, verified={view.verified}):\n{view.text}")
+        return "\n\n".join(lines)
+
+    async def analyze_signal_batch(
+        self,
+        items: List[Dict[str, Any]],
+        batch_size: int = 8
+    ) -> List[SignalAnalysisResponse]:
+        """
+        Analyze several pending events in one Grok call per batch.
+
+        Packs up to batch_size events into a single request that returns a
+        JSON array (one TTFT and one amortized system prompt for the whole
+        batch). Each item is a dict with event_id, tweets, filters_used and
+        optional context. Batches whose array response doesn't line up fall
+        back to individual analyze_signal calls.
+        """
+        results: List[SignalAnalysisResponse] = []
+
+        for batch_start in range(0, len(items), batch_size):
+            batch = items[batch_start:batch_start + batch_size]
+
+            if len(batch) == 1:
+                item = batch[0]
+                results.append(await self.analyze_signal(
+                    event_id=item["event_id"],
+                    tweets=item["tweets"],
+                    filters_used=item["filters_used"],
+                    context=item.get("context")
+                ))
+                continue
+
+            sections = []
+            for i, item in enumerate(batch, 1):
+                sections.append(
+                    f"=== EVENT {i} ===\n"
+                    f"Event ID: {item['event_id']}\n"
+                    f"Filters Applied: {', '.join(item['filters_used'])}\n"
+                    + (f"Context: {item['context']}\n" if item.get("context") else "")
+                    + f"TWEETS:\n{self._format_tweets(item['tweets'])}"
+                )
+
+            # Wrapped in an object ({"analyses": [...]}) because JSON mode
+            # (response_format json_object) cannot emit a bare top-level array
+            user_prompt = (
+                f"Analyze the following {len(batch)} prediction market events.\n\n"
+                + "\n\n".join(sections)
+                + '\n\nReturn a JSON object of the form {"analyses": [...]} where '
+                "analyses[i] is the full signal analysis object (matching the "
+                "specified schema) for EVENT i+1, in order. "
+                "Respond with ONLY this JSON object."
+            )
+
+            try:
+                response = await self._call_grok(
+                    system_prompt=SIGNAL_ANALYSIS_SYSTEM_PROMPT,
+                    user_prompt=user_prompt,
+                    cache_system_prompt=True
+                )
+                if isinstance(response, dict):
+                    response = response.get("analyses")
+                if isinstance(response, list) and len(response) == len(batch):
+                    results.extend(SignalAnalysisResponse.from_dict(r) for r in response)
+                    continue
+                print(f"⚠️ [GrokClient] Batch response mismatch ({len(response) if isinstance(response, list) else type(response).__name__} for {len(batch)} events); retrying individually")
+            except Exception as e:
+                print(f"⚠️ [GrokClient] Batch analysis failed ({str(e)[:80]}); retrying individually")
+
+            for item in batch:
+                results.append(await self.analyze_signal(
+                    event_id=item["event_id"],
+                    tweets=item["tweets"],
+                    filters_used=item["filters_used"],
+                    context=item.get("context")
+                ))
+
+        return results
 
     async def _call_grok(
         self,
@@ -201,16 +538,56 @@ Respond with ONLY valid JSON matching the specified schema.
         tools: Optional[List[Dict[str, Any]]] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         return_full_response: bool = False,
-        max_retries: int = 3
+        max_retries: int = 3,
+        cache_system_prompt: bool = False,
+        cached_user_prefix: Optional[str] = None
     ) -> Any:
         """
         Internal method to call Grok API with retry logic for network errors.
+
+        Args:
+            cache_system_prompt: Mark the system message as a provider-side
+                prompt-cache segment (cached reads are billed at ~10% of input
+                price). Only worthwhile when the system prompt is byte-identical
+                across calls - never interpolate per-event values (event_id,
+                tweets, timestamps) into a cached segment; they belong in the
+                user-message tail.
+            cached_user_prefix: Optional static boilerplate placed before the
+                dynamic user prompt as a second cached segment.
         """
+        if cache_system_prompt:
+            system_content: Any = [self._cache_segment(system_prompt)]
+        else:
+            system_content = system_prompt
+
+        if cached_user_prefix:
+            user_content: Any = [
+                self._cache_segment(cached_user_prefix),
+                {"type": "text", "text": user_prompt},
+            ]
+        else:
+            user_content = user_prompt
+
+        # Deterministic JSON calls short-circuit on a content-hash cache hit
+        cache_key = None
+        if expect_json and not return_full_response and temperature <= CACHEABLE_TEMPERATURE:
+            cache_key = _response_cache_key(
+                self.model, system_prompt, user_prompt, temperature, tools,
+                cached_user_prefix
+            )
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                cached_at, cached_value = cached
+                if time.monotonic() - cached_at < RESPONSE_CACHE_TTL:
+                    _response_cache.move_to_end(cache_key)
+                    return cached_value
+                del _response_cache[cache_key]
+
         payload = {
             "model": self.model,
             "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
+                {"role": "system", "content": system_content},
+                {"role": "user", "content": user_content}
             ],
             "temperature": temperature,
             "max_tokens": max_tokens,
@@ -221,16 +598,35 @@ Respond with ONLY valid JSON matching the specified schema.
         if tool_choice:
             payload["tool_choice"] = tool_choice
 
+        # Native JSON mode: the server emits bare JSON, so the fence-strip
+        # fallback becomes a rare path and no tokens are spent on wrappers
+        if expect_json and not tools:
+            payload["response_format"] = {"type": "json_object"}
+
+        # Serialize once up front; retries reuse the same bytes instead of
+        # re-walking the multi-KB payload dict per attempt
+        body = _encode_payload(payload)
+        extra_headers = None
+        if len(body) > GZIP_THRESHOLD_BYTES:
+            body = gzip.compress(body, compresslevel=1)
+            extra_headers = {"Content-Encoding": "gzip"}
+
+        client = await self._ensure_client()
+
         last_error = None
         for attempt in range(max_retries):
             try:
-                response = await self.client.post(
-                    f"{self.base_url}/v1/chat/completions",
-                    json=payload,
-                )
+                async with _get_grok_semaphore():
+                    response = await client.post(
+                        f"{self.base_url}/v1/chat/completions",
+                        content=body,
+                        headers=extra_headers,
+                    )
                 response.raise_for_status()
-                result = response.json()
-                message = result["choices"][0]["message"]
+                # Decode the raw bytes directly (skips httpx's text-decode
+                # round trip) and keep only the message we actually use so
+                # the rest of the envelope (usage, logprobs, ...) is freed
+                message = _loads(response.content)["choices"][0]["message"]
                 
                 if return_full_response:
                     return message
@@ -244,22 +640,43 @@ Respond with ONLY valid JSON matching the specified schema.
                 if not expect_json:
                     return text
 
-                parsed = self._extract_json(text)
+                # Fast path: JSON mode returns bare JSON; fall back to the
+                # fence extractor if the server ignored the flag
+                try:
+                    parsed = _loads(text)
+                except (json.JSONDecodeError, ValueError):
+                    parsed = self._extract_json(text)
+
+                if cache_key is not None:
+                    _response_cache[cache_key] = (time.monotonic(), parsed)
+                    _response_cache.move_to_end(cache_key)
+                    while len(_response_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+                        _response_cache.popitem(last=False)
+
                 return parsed
 
             except httpx.HTTPStatusError as e:
+                status = e.response.status_code if e.response else None
+                if status in _RETRYABLE_STATUSES and attempt < max_retries - 1:
+                    # Transient server pressure - retry with full jitter
+                    last_error = e
+                    wait_time = _retry_delay(attempt)
+                    print(f"⚠️ [GrokClient] HTTP {status} (attempt {attempt + 1}/{max_retries})")
+                    print(f"   Retrying in {wait_time:.2f}s...")
+                    await asyncio.sleep(wait_time)
+                    continue
                 detail = e.response.text if e.response else ""
                 raise RuntimeError(
-                    f"Grok API error: {e.response.status_code if e.response else 'unknown'} "
+                    f"Grok API error: {status if status else 'unknown'} "
                     f"{detail}"
                 )
             except (httpx.ReadError, httpx.ConnectError, httpx.TimeoutException) as e:
-                # Network errors - retry with exponential backoff
+                # Network errors - retry with jittered exponential backoff
                 last_error = e
                 if attempt < max_retries - 1:
-                    wait_time = (2 ** attempt) + 0.5  # 0.5s, 2.5s, 4.5s
+                    wait_time = _retry_delay(attempt)
                     print(f"⚠️ [GrokClient] Network error (attempt {attempt + 1}/{max_retries}): {e}")
-                    print(f"   Retrying in {wait_time}s...")
+                    print(f"   Retrying in {wait_time:.2f}s...")
                     await asyncio.sleep(wait_time)
                     continue
                 raise RuntimeError(f"Grok API network error after {max_retries} retries: {e}")
@@ -271,29 +688,115 @@ Respond with ONLY valid JSON matching the specified schema.
         # Should not reach here, but just in case
         raise RuntimeError(f"Grok API failed after {max_retries} retries: {last_error}")
 
+    async def _call_grok_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.3,
+        max_tokens: int = 16000,
+        cache_system_prompt: bool = False,
+    ):
+        """
+        Stream a completion, yielding content deltas as they arrive.
+
+        Callers that parse incrementally (e.g. the historical synthesis)
+        get time-to-first-token instead of waiting out the full response.
+        """
+        if cache_system_prompt:
+            system_content: Any = [self._cache_segment(system_prompt)]
+        else:
+            system_content = system_prompt
+
+        payload = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_content},
+                {"role": "user", "content": user_prompt}
+            ],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": True,
+        }
+
+        client = await self._ensure_client()
+        body = _encode_payload(payload)
+
+        async with _get_grok_semaphore():
+            async with client.stream(
+                "POST",
+                f"{self.base_url}/v1/chat/completions",
+                content=body,
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line.startswith("data: "):
+                        continue
+                    data = line[6:]
+                    if data == "[DONE]":
+                        break
+                    try:
+                        chunk = _loads(data)
+                    except (json.JSONDecodeError, ValueError):
+                        continue
+                    choices = chunk.get("choices") or []
+                    if not choices:
+                        continue
+                    delta = choices[0].get("delta", {}).get("content")
+                    if delta:
+                        yield delta
+
+    @staticmethod
+    def _cache_segment(text: str) -> Dict[str, Any]:
+        """
+        Wrap text in a content segment marked for provider-side prompt caching
+        (Anthropic-style `cache_control`; ignored by providers without support).
+        """
+        return {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+
     @staticmethod
-    def _extract_json(text: str) -> Dict[str, Any]:
+    def _extract_json(text: str) -> Union[Dict[str, Any], List[Any]]:
         """
         Grok sometimes wraps JSON in fences; normalize and parse.
+        Returns an object or, for batched prompts, an array.
         """
-        if "```json" in text:
-            json_str = text.split("```json", 1)[1].split("```", 1)[0].strip()
-        elif "```" in text:
-            json_str = text.split("```", 1)[1].split("```", 1)[0].strip()
-        else:
-            json_str = text.strip()
+        # One C-level regex scan; no intermediate split lists
+        match = _FENCE_RE.search(text)
+        json_str = (match.group(1) if match else text).strip()
 
         if not json_str:
             raise RuntimeError("No JSON content found in Grok response")
 
-        return json.loads(json_str)
+        return _loads(json_str)
 
     async def close(self):
         """Close the HTTP client (only if we own it, not for shared client)"""
-        if self._owns_client and not self.client.is_closed:
+        if self._owns_client and self.client is not None and not self.client.is_closed:
             await self.client.aclose()
 
 
+# --- Shared background loop for sync wrappers ---
+# All GrokClientSync instances schedule onto one daemon-thread loop, so the
+# shared httpx pool binds to a single reactor and keepalive reuse spans
+# every sync caller in the process.
+
+_bg_loop: Optional[asyncio.AbstractEventLoop] = None
+_bg_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get or start the process-wide background event loop."""
+    global _bg_loop
+    if _bg_loop is None or _bg_loop.is_closed():
+        with _bg_loop_lock:
+            if _bg_loop is None or _bg_loop.is_closed():
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="grok-sync-loop", daemon=True
+                ).start()
+                _bg_loop = loop
+    return _bg_loop
+
+
 # Synchronous wrapper for easier use
 class GrokClientSync:
     """Synchronous wrapper around async GrokClient"""
@@ -307,15 +810,15 @@ class GrokClientSync:
         model: str = DEFAULT_MODEL,
     ):
         """Initialize synchronous Grok client"""
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
+        self._loop = _get_background_loop()
+        self._closed = False
         self.async_client = GrokClient(api_key, base_url, timeout=timeout, model=model)
 
     def _run(self, coro):
-        """Run a coroutine on the dedicated event loop."""
-        if self.loop.is_closed():
+        """Run a coroutine on the shared background loop."""
+        if self._closed:
             raise RuntimeError("Attempted to use GrokClientSync after it was closed.")
-        return self.loop.run_until_complete(coro)
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
 
     def select_filters(
         self,
@@ -341,11 +844,24 @@ class GrokClientSync:
         )
 
     def close(self):
-        """Close the client and its loop."""
-        if self.loop.is_closed():
+        """Close this wrapper's async client (the loop is process-global)."""
+        if self._closed:
             return
-        self.loop.run_until_complete(self.async_client.close())
-        self.loop.close()
+        self._closed = True
+        # The daemon loop thread dies first during interpreter shutdown;
+        # skip scheduling onto a dead loop and bound the wait so a frozen
+        # loop (e.g. __del__ at exit) can't hang the process
+        if not self._loop.is_running():
+            return
+        future = asyncio.run_coroutine_threadsafe(
+            self.async_client.close(), self._loop
+        )
+        try:
+            future.result(timeout=5.0)
+        except (TimeoutError, concurrent.futures.TimeoutError):
+            # concurrent.futures.TimeoutError only became the builtin
+            # TimeoutError in 3.11; catch both for 3.10
+            future.cancel()
 
     def __del__(self):
         """Cleanup on deletion"""
@@ -9,14 +9,31 @@ Flow:
 5. Persist signal snapshot for time-series tracking
 """
 
+import hashlib
+import itertools
 import json
+import logging
 import os
+import statistics
+import threading
+import time
 import uuid
-from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional
+
+# diskcache persists orchestrator-level cache hits across process restarts;
+# without it the cache is in-memory only
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
 
 from .grok_client import GrokClientSync
 from .schemas import (
+    _dumps_indented,
     EventSignalTimeSeries,
     FilterSelectionResponse,
     FilterType,
@@ -33,18 +50,90 @@ except ImportError:  # pragma: no cover - dependency/ENV issue
     search_recent = None
 
 
+logger = logging.getLogger(__name__)
+
+
+# Concurrent chunk analyses per event; sized to stay under Grok rate limits
+MAX_CONCURRENT_CHUNKS = 8
+
+# Default search query per filter type, built once and frozen
+_DEFAULT_QUERIES: Mapping[FilterType, str] = MappingProxyType({
+    FilterType.MARKET_LINKS: "(url:polymarket.com OR url:kalshi.com) -is:retweet",
+    FilterType.BREAKING_NEWS: "(\"breaking news\" OR \"just announced\") is:verified -is:retweet lang:en",
+    FilterType.RESOLUTION_LANGUAGE: "(\"officially announced\" OR \"declared winner\") is:verified -is:retweet",
+    FilterType.NEWS_AGENCIES: "(from:AP OR from:Reuters OR from:Bloomberg) -is:retweet",
+    FilterType.FINANCE_CRYPTO: "(bitcoin OR ethereum) (ETF OR approval OR SEC) is:verified -is:retweet",
+})
+
+# Cache TTLs: signal analyses go stale quickly, filter selections don't
+SIGNAL_CACHE_TTL = 3600.0
+FILTER_CACHE_TTL = 86400.0
+
+
+class GrokCache:
+    """
+    Keyed cache for orchestrator-level Grok responses.
+
+    Time-series polling re-analyzes the same event (and often the same
+    tweet chunks) repeatedly; hits here skip the network round-trip
+    entirely. Values are plain dicts (to_dict output). Backed by diskcache
+    when installed so hits survive restarts, in-memory otherwise.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self._lock = threading.Lock()
+        self._memory: Dict[str, tuple] = {}
+        self._disk = None
+        if diskcache is not None:
+            self._disk = diskcache.Cache(directory or ".grok_cache")
+
+    @staticmethod
+    def make_key(op: str, **parts: Any) -> str:
+        """Content hash over the operation name and its inputs."""
+        material = json.dumps({"op": op, **parts}, sort_keys=True, default=str)
+        return hashlib.blake2b(material.encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        if self._disk is not None:
+            return self._disk.get(key)
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._memory[key]
+                return None
+            return value
+
+    def set(self, key: str, value: Dict[str, Any], ttl: float) -> None:
+        if self._disk is not None:
+            self._disk.set(key, value, expire=ttl)
+            return
+        with self._lock:
+            self._memory[key] = (time.monotonic() + ttl, value)
+
+
 class PipelineOrchestrator:
     """Orchestrates the multi-step Grok pipeline"""
 
-    def __init__(self, grok_api_key: Optional[str] = None):
+    def __init__(self, grok_api_key: Optional[str] = None, max_events: int = 10_000):
         """
         Initialize the orchestrator.
 
         Args:
             grok_api_key: Optional Grok API key (defaults to env var)
+            max_events: Cap on tracked event time-series; the least recently
+                touched series is evicted beyond this (long-lived processes
+                would otherwise grow without bound)
         """
         self.grok_client = GrokClientSync(api_key=grok_api_key)
-        self.event_timeseries: Dict[str, EventSignalTimeSeries] = {}
+        self.grok_cache = GrokCache()
+        self.max_events = max_events
+        # LRU-ordered and lock-guarded: parallel process_event calls mutate
+        # this from worker threads
+        self.event_timeseries: "OrderedDict[str, EventSignalTimeSeries]" = OrderedDict()
+        self._timeseries_lock = threading.Lock()
 
     def process_event_direct_search(
         self,
@@ -53,38 +142,50 @@ class PipelineOrchestrator:
         event_id: Optional[str] = None,
         max_tweets: int = 100,
         *,
+        max_prompt_tokens: int = 6000,
+        include_chunk_details: bool = False,
         verbose: bool = True,
         progress_hook: Optional[Callable[[str, Dict[str, Any]], None]] = None,
     ) -> Dict[str, Any]:
         """
         Direct search without Grok filter selection.
-        Searches for raw query, then chunks results into 25 for analysis.
+        Searches for raw query, then packs results into token-budgeted
+        chunks for analysis.
         """
-        log = print if verbose else (lambda *args, **kwargs: None)
+        # verbose routes progress to INFO; otherwise it drops to DEBUG so a
+        # disabled level costs nothing (lazy %-formatting throughout)
+        level = logging.INFO if verbose else logging.DEBUG
+
+        def log(msg: str, *args: Any) -> None:
+            logger.log(level, msg, *args)
+
         hook = progress_hook or (lambda *_args, **_kwargs: None)
         if not event_id:
             event_id = f"event_{uuid.uuid4().hex[:8]}"
 
-        log(f"\n{'='*80}")
-        log(f"DIRECT SEARCH: {event_description}")
-        log(f"Query: {search_query}")
-        log(f"{'='*80}\n")
+        log("%s", "=" * 80)
+        log("DIRECT SEARCH: %s", event_description)
+        log("Query: %s", search_query)
+        log("%s", "=" * 80)
 
         # Collect tweets
-        log(f"[1/2] Searching X API directly...")
+        log("[1/2] Searching X API directly...")
         hook("search_started", {"event_id": event_id, "query": search_query})
         try:
-            tweets_data = self._search_tweets(search_query)
-            tweets_collected = tweets_data[:max_tweets]
-            log(f"✓ Collected {len(tweets_collected)} tweets\n")
+            # Bounded generator: normalization stops as soon as max_tweets
+            # are taken instead of materializing the full result set
+            tweets_collected = list(
+                itertools.islice(self._search_tweets(search_query), max_tweets)
+            )
+            log("✓ Collected %d tweets", len(tweets_collected))
             hook("search_succeeded", {"event_id": event_id, "count": len(tweets_collected)})
         except Exception as e:
-            log(f"✗ Search failed: {e}\n")
+            log("✗ Search failed: %s", e)
             hook("search_failed", {"event_id": event_id, "error": str(e)})
             return {"status": "error", "error": str(e), "event_id": event_id}
 
         if not tweets_collected:
-            log("⚠ No tweets found for query; skipping analysis.\n")
+            log("⚠ No tweets found for query; skipping analysis.")
             hook("no_tweets", {"event_id": event_id})
             return {
                 "status": "no_tweets",
@@ -93,82 +194,134 @@ class PipelineOrchestrator:
                 "chunks_analyzed": 0,
             }
 
-        # Chunk into 25 and analyze each chunk
-        log(f"[2/2] Analyzing {len(tweets_collected)} tweets in chunks of 25...")
-        chunk_size = 25
-        all_analyses = []
-        total_chunks = (len(tweets_collected) + chunk_size - 1) // chunk_size
-        
-        for i in range(0, len(tweets_collected), chunk_size):
-            chunk = tweets_collected[i:i+chunk_size]
-            chunk_num = (i // chunk_size) + 1
-            log(f"\n  Chunk {chunk_num}/{total_chunks} ({len(chunk)} tweets)...")
+        # Pack tweets into token-budgeted chunks and analyze them
+        # concurrently - no chunk depends on another's result, so latency is
+        # bounded by the slowest call instead of the sum
+        # Materialize the dict form of every tweet exactly once; the chunks
+        # below share those cached dicts
+        tweet_dicts_all = [
+            t.to_dict() if hasattr(t, 'to_dict') else t for t in tweets_collected
+        ]
+        chunks = self._pack_chunks(tweet_dicts_all, max_tokens=max_prompt_tokens)
+        total_chunks = len(chunks)
+        log(
+            "[2/2] Analyzing %d tweets in %d packed chunks (~%d tokens each, max %d concurrent)...",
+            len(tweets_collected), total_chunks, max_prompt_tokens, MAX_CONCURRENT_CHUNKS
+        )
+
+        def _analyze_chunk(chunk_num: int, chunk: list):
             hook("chunk_started", {
                 "event_id": event_id,
                 "chunk": chunk_num,
                 "total_chunks": total_chunks,
                 "size": len(chunk),
             })
-            try:
-                signal_response = self.grok_client.analyze_signal(
-                    event_id=f"{event_id}_chunk{chunk_num}",
-                    tweets=[t.to_dict() if hasattr(t, 'to_dict') else t for t in chunk],
-                    filters_used=["direct_search"],
-                    context=event_description
-                )
-                log(f"    ✓ Signal: {signal_response.overall_signal_strength:.1f}/100")
-                log(f"    ✓ Sentiment: {signal_response.metrics.dominant_sentiment}")
-                all_analyses.append(signal_response)
-                hook("chunk_succeeded", {
-                    "event_id": event_id,
-                    "chunk": chunk_num,
-                    "total_chunks": total_chunks,
-                    "signal": signal_response.overall_signal_strength,
-                    "sentiment": str(signal_response.metrics.dominant_sentiment),
-                })
-            except Exception as e:
-                log(f"    ✗ Analysis failed: {e}")
-                hook("chunk_failed", {
-                    "event_id": event_id,
-                    "chunk": chunk_num,
-                    "total_chunks": total_chunks,
-                    "error": str(e),
-                })
-                continue
+            cache_key = GrokCache.make_key(
+                "analyze_signal",
+                tweets=[t.get("tweet_id") or t.get("id", "") for t in chunk],
+                context=event_description,
+                filters=["direct_search"],
+            )
+            cached = self.grok_cache.get(cache_key)
+            if cached is not None:
+                hook("cache_hit", {"event_id": event_id, "chunk": chunk_num, "op": "analyze_signal"})
+                return SignalAnalysisResponse.from_dict(cached)
 
-        log(f"\n{'='*80}")
-        log(f"RESULTS")
-        log(f"{'='*80}\n")
+            signal_response = self.grok_client.analyze_signal(
+                event_id=f"{event_id}_chunk{chunk_num}",
+                tweets=chunk,
+                filters_used=["direct_search"],
+                context=event_description
+            )
+            self.grok_cache.set(cache_key, signal_response.to_dict(), ttl=SIGNAL_CACHE_TTL)
+            return signal_response
+
+        analyses_by_chunk: Dict[int, Any] = {}
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_CHUNKS, total_chunks)) as pool:
+            futures = {
+                pool.submit(_analyze_chunk, chunk_num, chunk): chunk_num
+                for chunk_num, chunk in enumerate(chunks, 1)
+            }
+            for future in as_completed(futures):
+                chunk_num = futures[future]
+                try:
+                    signal_response = future.result()
+                    log(
+                        "  ✓ Chunk %d/%d: signal %.1f/100, %s",
+                        chunk_num, total_chunks,
+                        signal_response.overall_signal_strength,
+                        signal_response.metrics.dominant_sentiment
+                    )
+                    analyses_by_chunk[chunk_num] = signal_response
+                    hook("chunk_succeeded", {
+                        "event_id": event_id,
+                        "chunk": chunk_num,
+                        "total_chunks": total_chunks,
+                        "signal": signal_response.overall_signal_strength,
+                        "sentiment": str(signal_response.metrics.dominant_sentiment),
+                    })
+                except Exception as e:
+                    log("  ✗ Chunk %d/%d failed: %s", chunk_num, total_chunks, e)
+                    hook("chunk_failed", {
+                        "event_id": event_id,
+                        "chunk": chunk_num,
+                        "total_chunks": total_chunks,
+                        "error": str(e),
+                    })
+
+        # Keep chunk order for aggregation regardless of completion order
+        all_analyses = [analyses_by_chunk[n] for n in sorted(analyses_by_chunk)]
+
+        log("%s", "=" * 80)
+        log("RESULTS")
+        log("%s", "=" * 80)
 
         if all_analyses:
-            # Aggregate results
-            avg_signal = sum(a.overall_signal_strength for a in all_analyses) / len(all_analyses)
-            log(f"✅ Analyzed {len(all_analyses)} chunks")
-            log(f"   Average Signal: {avg_signal:.1f}/100")
+            # Aggregate results: one attribute walk to pull the floats and
+            # sentiments, then C-speed statistics over the flat lists
+            signals = []
+            sentiment_counts: Counter = Counter()
+            for a in all_analyses:
+                signals.append(a.overall_signal_strength)
+                sentiment_counts[a.metrics.dominant_sentiment] += 1
+            avg_signal = statistics.fmean(signals)
+            signal_std = statistics.pstdev(signals) if len(signals) > 1 else 0.0
+            dominant_sentiment = sentiment_counts.most_common(1)[0][0]
+            log("✅ Analyzed %d chunks", len(all_analyses))
+            log("   Average Signal: %.1f/100", avg_signal)
             hook("analysis_complete", {
                 "event_id": event_id,
                 "chunks": len(all_analyses),
                 "avg_signal": avg_signal,
             })
-            
-            # Show each chunk
-            for i, analysis in enumerate(all_analyses, 1):
-                log(f"\n   Chunk {i}:")
-                log(f"      Signal: {analysis.overall_signal_strength:.1f}/100")
-                log(f"      Sentiment: {analysis.metrics.dominant_sentiment}")
-                log(f"      Themes: {', '.join(analysis.metrics.key_themes[:3])}")
-                log(f"      Implication: {analysis.prediction_market_implication[:100]}...")
-            
-            return {
+
+            # Show each chunk (debug only - the joins aren't free)
+            if logger.isEnabledFor(logging.DEBUG):
+                for i, analysis in enumerate(all_analyses, 1):
+                    logger.debug("   Chunk %d:", i)
+                    logger.debug("      Signal: %.1f/100", analysis.overall_signal_strength)
+                    logger.debug("      Sentiment: %s", analysis.metrics.dominant_sentiment)
+                    logger.debug("      Themes: %s", ", ".join(analysis.metrics.key_themes[:3]))
+                    logger.debug("      Implication: %.100s...", analysis.prediction_market_implication)
+
+            result = {
                 "status": "success",
                 "event_id": event_id,
                 "tweets_collected": len(tweets_collected),
                 "chunks_analyzed": len(all_analyses),
                 "avg_signal": avg_signal,
-                "chunk_analyses": [a.to_dict() for a in all_analyses]
+                "signal_min": min(signals),
+                "signal_max": max(signals),
+                "signal_std": signal_std,
+                "dominant_sentiment": dominant_sentiment.value,
             }
+            # Materializing every per-chunk response is wasted work for
+            # callers that only want the summary - opt in instead
+            if include_chunk_details:
+                result["chunk_analyses"] = [a.to_dict() for a in all_analyses]
+            return result
         else:
-            log(f"⚠️  No successful analyses")
+            log("⚠️  No successful analyses")
             hook("analysis_complete", {
                 "event_id": event_id,
                 "chunks": 0,
@@ -202,44 +355,59 @@ class PipelineOrchestrator:
         if not event_id:
             event_id = f"event_{uuid.uuid4().hex[:8]}"
 
-        print(f"\n{'='*80}")
-        print(f"PIPELINE START: {event_id}")
-        print(f"{'='*80}\n")
+        logger.info("%s", "=" * 80)
+        logger.info("PIPELINE START: %s", event_id)
+        logger.info("%s", "=" * 80)
 
         # ====================================================================
         # STEP 1: Event → Filter Selection
         # ====================================================================
-        print(f"[1/4] Selecting filters for: {event_description}")
+        logger.info("[1/4] Selecting filters for: %s", event_description)
         try:
-            filter_response = self.grok_client.select_filters(
-                event_id=event_id,
-                event_description=event_description,
-                prediction_markets=prediction_markets
+            filter_cache_key = GrokCache.make_key(
+                "select_filters",
+                event=event_description,
+                markets=prediction_markets or [],
             )
-            print(f"✓ Selected {len(filter_response.recommended_filters)} filters")
-            print(f"  Reasoning: {filter_response.reasoning}\n")
+            cached_filters = self.grok_cache.get(filter_cache_key)
+            if cached_filters is not None:
+                logger.info("⚡ Filter selection cache hit")
+                filter_response = FilterSelectionResponse.from_dict(cached_filters)
+                filter_response.event_id = event_id  # cached under an older run's id
+            else:
+                filter_response = self.grok_client.select_filters(
+                    event_id=event_id,
+                    event_description=event_description,
+                    prediction_markets=prediction_markets
+                )
+                self.grok_cache.set(
+                    filter_cache_key, filter_response.to_dict(), ttl=FILTER_CACHE_TTL
+                )
+            logger.info("✓ Selected %d filters", len(filter_response.recommended_filters))
+            logger.info("  Reasoning: %s", filter_response.reasoning)
         except Exception as e:
-            print(f"✗ Filter selection failed: {e}\n")
+            logger.info("✗ Filter selection failed: %s", e)
             return {"status": "error", "error": str(e), "event_id": event_id}
 
         # ====================================================================
         # STEP 2: Filters → Raw Tweets
         # ====================================================================
-        print(f"[2/4] Executing filters to collect tweets...")
+        logger.info("[2/4] Executing filters to collect tweets...")
         try:
             tweets_result = self._execute_filters(
                 event_id=event_id,
                 filter_response=filter_response
             )
-            print(f"✓ Collected {tweets_result.total_tweets} tweets")
-            print(f"  Filters executed: {[f.value for f in tweets_result.filters_executed]}\n")
+            logger.info("✓ Collected %d tweets", tweets_result.total_tweets)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("  Filters executed: %s", [f.value for f in tweets_result.filters_executed])
         except Exception as e:
-            print(f"✗ Tweet collection failed: {e}\n")
+            logger.info("✗ Tweet collection failed: %s", e)
             return {"status": "error", "error": str(e), "event_id": event_id}
 
         # Return early if no tweets collected
         if tweets_result.total_tweets == 0:
-            print("⚠ No tweets collected. Skipping signal analysis.\n")
+            logger.info("⚠ No tweets collected. Skipping signal analysis.")
             return {
                 "status": "no_tweets",
                 "event_id": event_id,
@@ -250,7 +418,7 @@ class PipelineOrchestrator:
         # ====================================================================
         # STEP 3: Tweets → Signal Analysis
         # ====================================================================
-        print(f"[3/4] Analyzing signal from tweets...")
+        logger.info("[3/4] Analyzing signal from tweets...")
         signal_response = None
         try:
             # Prepare tweets for Grok (convert to dict format)
@@ -262,13 +430,13 @@ class PipelineOrchestrator:
                 filters_used=[f.value for f in tweets_result.filters_executed],
                 context=event_description
             )
-            print(f"✓ Signal strength: {signal_response.overall_signal_strength}/100")
-            print(f"  Dominant sentiment: {signal_response.metrics.dominant_sentiment.value}")
-            print(f"  Confidence: {signal_response.signal_confidence.value}")
-            print(f"  Implication: {signal_response.prediction_market_implication}\n")
+            logger.info("✓ Signal strength: %s/100", signal_response.overall_signal_strength)
+            logger.info("  Dominant sentiment: %s", signal_response.metrics.dominant_sentiment.value)
+            logger.info("  Confidence: %s", signal_response.signal_confidence.value)
+            logger.info("  Implication: %s", signal_response.prediction_market_implication)
         except Exception as e:
-            print(f"⚠️  Signal analysis failed: {e}")
-            print(f"  Proceeding with tweet data only\n")
+            logger.info("⚠️  Signal analysis failed: %s", e)
+            logger.info("  Proceeding with tweet data only")
             signal_response = None
 
         # ====================================================================
@@ -276,22 +444,22 @@ class PipelineOrchestrator:
         # ====================================================================
         timeseries = None
         if signal_response:
-            print(f"[4/4] Persisting signal snapshot...")
+            logger.info("[4/4] Persisting signal snapshot...")
             try:
                 timeseries = self._persist_signal(
                     event_id=event_id,
                     event_description=event_description,
                     signal_response=signal_response
                 )
-                print(f"✓ Signal persisted")
-                print(f"  Trend: {timeseries.trend}")
-                print(f"  Total snapshots: {len(timeseries.snapshots)}\n")
+                logger.info("✓ Signal persisted")
+                logger.info("  Trend: %s", timeseries.trend)
+                logger.info("  Total snapshots: %d", len(timeseries.snapshots))
             except Exception as e:
-                print(f"⚠️  Signal persistence failed: {e}\n")
+                logger.info("⚠️  Signal persistence failed: %s", e)
 
-        print(f"{'='*80}")
-        print(f"PIPELINE COMPLETE: {event_id}")
-        print(f"{'='*80}\n")
+        logger.info("%s", "=" * 80)
+        logger.info("PIPELINE COMPLETE: %s", event_id)
+        logger.info("%s", "=" * 80)
 
         # Return complete pipeline results
         return {
@@ -304,6 +472,40 @@ class PipelineOrchestrator:
             "timeseries": timeseries.to_dict() if timeseries else None
         }
 
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """Cheap token estimate (~4 chars/token for English text)."""
+        return max(1, len(text) // 4)
+
+    def _pack_chunks(
+        self,
+        tweet_dicts: List[Dict[str, Any]],
+        max_tokens: int = 6000,
+        max_tweets_per_chunk: int = 25
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Greedily pack tweets into chunks up to a token budget.
+
+        Short tweets fill each Grok call instead of wasting capacity on a
+        fixed count, while long tweets can't blow the context window. The
+        25-tweet cap matches the limit analyze_signal formats per prompt.
+        """
+        chunks: List[List[Dict[str, Any]]] = []
+        current: List[Dict[str, Any]] = []
+        budget = 0
+        for tweet in tweet_dicts:
+            # ~20 tokens of per-tweet prompt framing on top of the text
+            cost = self._estimate_tokens(tweet.get("text", "")) + 20
+            if current and (budget + cost > max_tokens or len(current) >= max_tweets_per_chunk):
+                chunks.append(current)
+                current = []
+                budget = 0
+            current.append(tweet)
+            budget += cost
+        if current:
+            chunks.append(current)
+        return chunks
+
     def _execute_filters(
         self,
         event_id: str,
@@ -314,13 +516,20 @@ class PipelineOrchestrator:
         
         This is where we actually search for tweets using the recommended filters.
         """
+        # One logical timestamp for the whole filter-execution stage
+        # (utcnow() is deprecated and naive; now(timezone.utc) is neither)
+        stage_timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
         # Sort by priority
         sorted_filters = sorted(
             filter_response.recommended_filters,
             key=lambda x: x.priority
         )
 
-        all_tweets = []
+        # Dedup on tweet_id: overlapping filters (e.g. BREAKING_NEWS and
+        # NEWS_AGENCIES) routinely return the same tweet, and duplicates
+        # inflate the Grok prompt token bill for nothing
+        seen: Dict[str, TweetData] = {}
         executed_filters = []
 
         # Execute each filter in priority order
@@ -331,13 +540,21 @@ class PipelineOrchestrator:
             # Use custom query if provided, otherwise use default
             query = filter_rec.custom_query or self._get_default_query(filter_type)
 
-            print(f"  • Executing {filter_type.value}: {query[:60]}...")
+            logger.info("  • Executing %s: %.60s...", filter_type.value, query)
 
             try:
                 tweets = self._search_tweets(query)
                 for tweet in tweets:
-                    tweet_obj = TweetData(
-                        tweet_id=tweet.get("id", ""),
+                    tweet_id = tweet.get("id", "")
+                    existing = seen.get(tweet_id)
+                    if existing is not None:
+                        # Same tweet matched another filter - merge the tag
+                        if filter_type.value not in existing.matching_filters:
+                            existing.matching_filters.append(filter_type.value)
+                        continue
+
+                    seen[tweet_id] = TweetData(
+                        tweet_id=tweet_id,
                         text=tweet.get("text", ""),
                         author_id=tweet.get("author_id", ""),
                         author_username=tweet.get("author_username", "unknown"),
@@ -347,26 +564,28 @@ class PipelineOrchestrator:
                         is_retweet=tweet.get("is_retweet", False),
                         engagement_metrics=tweet.get("engagement_metrics", {})
                     )
-                    all_tweets.append(tweet_obj)
 
             except Exception as e:
-                print(f"    (Error: {e})")
+                logger.info("    (Error: %s)", e)
                 continue
 
+        all_tweets = list(seen.values())
         return TweetCollectionResult(
             event_id=event_id,
             filters_executed=executed_filters,
             tweets_collected=all_tweets,
             total_tweets=len(all_tweets),
-            timestamp=datetime.utcnow().isoformat()
+            timestamp=stage_timestamp
         )
 
-    def _search_tweets(self, query: str, *, max_results: int = 100) -> List[Dict[str, Any]]:
+    def _search_tweets(self, query: str, *, max_results: int = 100) -> Iterator[Dict[str, Any]]:
         """
         Execute a tweet search using the X API via `tweets.runner.search_recent`.
 
-        Returns a normalized list of tweet dictionaries. Raises a RuntimeError
-        if required dependencies or environment variables are missing.
+        Yields normalized tweet dictionaries lazily so callers taking fewer
+        results (e.g. via islice) skip normalization of the excess. Raises a
+        RuntimeError if required dependencies or environment variables are
+        missing.
         """
         if search_recent is None:
             raise RuntimeError(
@@ -378,15 +597,12 @@ class PipelineOrchestrator:
         if not bearer:
             raise RuntimeError("X_BEARER_TOKEN is not set; cannot query X API.")
 
-        tweets = search_recent(query, max_results=max_results)
-        normalized: List[Dict[str, Any]] = []
-
-        for tweet in tweets:
+        for tweet in search_recent(query, max_results=max_results):
             if isinstance(tweet, dict):
-                normalized.append(tweet)
+                yield tweet
                 continue
 
-            normalized.append({
+            yield {
                 "id": getattr(tweet, "id", ""),
                 "text": getattr(tweet, "text", ""),
                 "author_id": getattr(tweet, "author_id", ""),
@@ -395,20 +611,11 @@ class PipelineOrchestrator:
                 "is_verified": getattr(tweet, "is_verified", False),
                 "is_retweet": getattr(tweet, "is_retweet", False),
                 "engagement_metrics": getattr(tweet, "engagement_metrics", {}),
-            })
-
-        return normalized
+            }
 
     def _get_default_query(self, filter_type: FilterType) -> str:
         """Get the default query for a filter type"""
-        default_queries = {
-            FilterType.MARKET_LINKS: "(url:polymarket.com OR url:kalshi.com) -is:retweet",
-            FilterType.BREAKING_NEWS: "(\"breaking news\" OR \"just announced\") is:verified -is:retweet lang:en",
-            FilterType.RESOLUTION_LANGUAGE: "(\"officially announced\" OR \"declared winner\") is:verified -is:retweet",
-            FilterType.NEWS_AGENCIES: "(from:AP OR from:Reuters OR from:Bloomberg) -is:retweet",
-            FilterType.FINANCE_CRYPTO: "(bitcoin OR ethereum) (ETF OR approval OR SEC) is:verified -is:retweet",
-        }
-        return default_queries.get(filter_type, "")
+        return _DEFAULT_QUERIES.get(filter_type, "")
 
     def _persist_signal(
         self,
@@ -429,39 +636,55 @@ class PipelineOrchestrator:
             key_themes=signal_response.metrics.key_themes
         )
 
-        # Get or create timeseries
-        if event_id not in self.event_timeseries:
-            self.event_timeseries[event_id] = EventSignalTimeSeries(
-                event_id=event_id,
-                event_description=event_description,
-                created_at=datetime.utcnow().isoformat(),
-                snapshots=[],
-                current_signal_strength=0.0,
-                trend="stable"
-            )
+        # Get or create timeseries (under the lock - concurrent events race
+        # on insertion and snapshot appends otherwise)
+        with self._timeseries_lock:
+            timeseries = self.event_timeseries.get(event_id)
+            if timeseries is None:
+                timeseries = EventSignalTimeSeries(
+                    event_id=event_id,
+                    event_description=event_description,
+                    created_at=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    snapshots=[],
+                    current_signal_strength=0.0,
+                    trend="stable"
+                )
+                self.event_timeseries[event_id] = timeseries
+                while len(self.event_timeseries) > self.max_events:
+                    self.event_timeseries.popitem(last=False)
+            else:
+                self.event_timeseries.move_to_end(event_id)
 
-        timeseries = self.event_timeseries[event_id]
-        timeseries.add_snapshot(snapshot)
-        timeseries.trend = timeseries.get_signal_trend()
+            timeseries.add_snapshot(snapshot)
+            timeseries.trend = timeseries.get_signal_trend()
 
         return timeseries
 
     def get_event_timeseries(self, event_id: str) -> Optional[EventSignalTimeSeries]:
         """Get the signal time-series for an event"""
-        return self.event_timeseries.get(event_id)
+        with self._timeseries_lock:
+            return self.event_timeseries.get(event_id)
 
     def get_all_timeseries(self) -> Dict[str, EventSignalTimeSeries]:
-        """Get all tracked event time-series"""
-        return self.event_timeseries
+        """Get a snapshot of all tracked event time-series"""
+        with self._timeseries_lock:
+            return dict(self.event_timeseries)
 
     def save_timeseries(self, filepath: str) -> None:
         """Save all event time-series to a JSON file"""
-        data = {
-            event_id: ts.to_dict()
-            for event_id, ts in self.event_timeseries.items()
-        }
+        with self._timeseries_lock:
+            data = {
+                event_id: ts.to_dict()
+                for event_id, ts in self.event_timeseries.items()
+            }
         with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+            f.write(_dumps_indented(data))
+
+    def __enter__(self) -> "PipelineOrchestrator":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     def close(self):
         """Close the Grok client"""
@@ -4,9 +4,28 @@ These define the exact JSON structure Grok should return.
 """
 
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from collections import deque
+from dataclasses import dataclass, field, asdict
 from enum import Enum
 import json
+import sys
+
+# orjson is several times faster than stdlib json on these nested payloads;
+# stdlib fallback keeps the module dependency-free
+try:
+    import orjson
+
+    def _dumps_indented(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode()
+
+    def _dumps_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str)
+except ImportError:
+    def _dumps_indented(obj: Any) -> str:
+        return json.dumps(obj, indent=2, default=str)
+
+    def _dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, default=str).encode()
 
 
 class FilterType(str, Enum):
@@ -18,6 +37,107 @@ class FilterType(str, Enum):
     FINANCE_CRYPTO = "finance_crypto_events"
 
 
+def _cache_enum_values(enum_cls):
+    """
+    Stash each member's value as a plain `_v` attribute: `.value` goes
+    through the enum DynamicClassAttribute descriptor on every access,
+    which adds up across hot to_dict serialization.
+    """
+    for member in enum_cls:
+        member._v = member.value
+    return enum_cls
+
+
+_cache_enum_values(FilterType)
+
+# Canonical values plus the variations Grok commonly returns, resolved with
+# one dict lookup in FilterSelectionResponse.from_dict
+_FILTER_ALIASES = {
+    **{ft.value: ft for ft in FilterType},
+    "breaking_news": FilterType.BREAKING_NEWS,
+    "news": FilterType.NEWS_AGENCIES,
+    "resolution_language": FilterType.RESOLUTION_LANGUAGE,
+    "finance": FilterType.FINANCE_CRYPTO,
+    "crypto": FilterType.FINANCE_CRYPTO,
+}
+
+
+def _quantize_half_step(value: float) -> int:
+    """
+    Quantize a 0-100 score to byte-range half-steps (0-200, max error
+    0.25). The flat buffers hold these small ints - a quarter of the bytes
+    of a float per reading - and the trend ratios are scale-invariant, so
+    the kernel runs on them unchanged.
+    """
+    return min(200, max(0, int(round(value * 2.0))))
+
+
+def _trend_kernel_impl(strengths) -> int:
+    """
+    Pure numeric trend kernel over a flat strength sequence.
+
+    Returns 0 insufficient_data, 1 increasing, 2 decreasing, 3 stable
+    (see _TREND_LABELS). Written with plain loops/arithmetic so numba can
+    JIT-compile it unchanged for batch re-scoring workloads.
+    """
+    n = len(strengths)
+    if n < 2:
+        return 0
+    k = 5 if n >= 5 else n
+    s_rec = 0.0
+    for i in range(n - k, n):
+        s_rec += strengths[i]
+    avg_rec = s_rec / k
+    if n <= 5:
+        return 3
+    s_bef = 0.0
+    for i in range(n - k):
+        s_bef += strengths[i]
+    avg_bef = s_bef / (n - k)
+    # Branchless fixed-point compare (0.1 quantization): the +/-10% bands
+    # become integer comparisons that compile to conditional moves, and
+    # 3 - 2*inc - dec maps (inc, dec) onto the label codes
+    a = int(avg_rec * 10.0)
+    inc = a > int(avg_bef * 11.0)
+    dec = a < int(avg_bef * 9.0)
+    return 3 - 2 * inc - dec
+
+
+def _trend_kernel(strengths) -> int:
+    """
+    First call resolves the real kernel, in preference order: the
+    AOT-compiled shared object (built via grok_pipeline.build_native, no
+    LLVM at runtime at all), a numba JIT compile, or the pure-Python impl.
+    Resolution is deferred because even numba's import costs hundreds of
+    ms for callers that never compute a trend.
+    """
+    global _trend_kernel
+    try:
+        from ._trend_native import trend_i4 as _native_trend
+        import numpy as _np
+    except ImportError:
+        try:
+            from numba import njit
+        except ImportError:
+            _trend_kernel = _trend_kernel_impl
+        else:
+            _trend_kernel = njit(cache=True, fastmath=True)(_trend_kernel_impl)
+    else:
+        def _trend_kernel(values, _native=_native_trend, _np=_np):
+            return _native(_np.asarray(values, dtype=_np.float32))
+    return _trend_kernel(strengths)
+
+_TREND_LABELS = ("insufficient_data", "increasing", "decreasing", "stable")
+
+
+def _classify_trend(avg_recent: float, avg_before: float) -> str:
+    """Apply the +/-10% bands (same fixed-point compare as the kernel)."""
+    a = int(avg_recent * 10.0)
+    inc = a > int(avg_before * 11.0)
+    dec = a < int(avg_before * 9.0)
+    return _TREND_LABELS[3 - 2 * inc - dec]
+
+
 class SignalSentiment(str, Enum):
     """Signal sentiment classification"""
     BULLISH = "bullish"
@@ -26,6 +146,18 @@ class SignalSentiment(str, Enum):
     MIXED = "mixed"
 
 
+_cache_enum_values(SignalSentiment)
+
+# The same handful of sentiment values and theme strings repeats across
+# every snapshot in a stream; interning collapses them to shared objects
+_SENTIMENT_VALUE = {s: sys.intern(s.value) for s in SignalSentiment}
+_THEME_INTERN: Dict[str, str] = {}
+
+
+def _intern_theme(theme: str) -> str:
+    return _THEME_INTERN.setdefault(theme, sys.intern(theme))
+
+
 class ConfidenceLevel(str, Enum):
     """Confidence in the signal"""
     HIGH = "high"
@@ -33,11 +165,14 @@ class ConfidenceLevel(str, Enum):
     LOW = "low"
 
 
+_cache_enum_values(ConfidenceLevel)
+
+
 # ============================================================================
 # STEP 1: Event → Filter Selection
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class FilterRecommendation:
     """A single filter recommendation from Grok"""
     filter_type: FilterType
@@ -48,15 +183,15 @@ class FilterRecommendation:
 
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "filter_type": self.filter_type.value,
+            "filter_type": self.filter_type._v,
             "justification": self.justification,
             "priority": self.priority,
-            "confidence": self.confidence.value,
+            "confidence": self.confidence._v,
             "custom_query": self.custom_query
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class FilterSelectionResponse:
     """Grok's response: which filters to apply for this event"""
     event_id: str
@@ -77,29 +212,19 @@ class FilterSelectionResponse:
         }
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict(), indent=2)
+        return _dumps_indented(self.to_dict())
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> "FilterSelectionResponse":
         """Parse Grok's response into this schema"""
         filters = []
         for f in data["recommended_filters"]:
-            filter_type_str = f["filter_type"].lower().replace("_", "_")
-            # Try to match to our enum
-            try:
-                filter_type = FilterType(filter_type_str)
-            except ValueError:
-                # If exact match fails, try common variations
-                mapping = {
-                    "market_links": FilterType.MARKET_LINKS,
-                    "breaking_news": FilterType.BREAKING_NEWS,
-                    "news": FilterType.NEWS_AGENCIES,
-                    "resolution_language": FilterType.RESOLUTION_LANGUAGE,
-                    "finance": FilterType.FINANCE_CRYPTO,
-                    "crypto": FilterType.FINANCE_CRYPTO,
-                }
-                filter_type = mapping.get(filter_type_str, FilterType.MARKET_LINKS)
-            
+            # Single precompiled alias lookup - no per-call mapping dict and
+            # no ValueError round-trip for common variations
+            filter_type = _FILTER_ALIASES.get(
+                f["filter_type"].lower(), FilterType.MARKET_LINKS
+            )
+
             filters.append(FilterRecommendation(
                 filter_type=filter_type,
                 justification=f["justification"],
@@ -121,7 +246,7 @@ class FilterSelectionResponse:
 # STEP 2: Filters → Raw Tweets (internal, not from Grok)
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class TweetData:
     """A single tweet from the search results"""
     tweet_id: str
@@ -148,7 +273,7 @@ class TweetData:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TweetCollectionResult:
     """Result from executing filters and collecting tweets"""
     event_id: str
@@ -160,7 +285,7 @@ class TweetCollectionResult:
     def to_dict(self) -> Dict[str, Any]:
         return {
             "event_id": self.event_id,
-            "filters_executed": [f.value for f in self.filters_executed],
+            "filters_executed": [f._v for f in self.filters_executed],
             "tweets_collected": [t.to_dict() for t in self.tweets_collected],
             "total_tweets": self.total_tweets,
             "timestamp": self.timestamp
@@ -171,7 +296,7 @@ class TweetCollectionResult:
 # STEP 3: Tweets → Signal Analysis (Grok analyzes sentiment/signal)
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class SignalMetrics:
     """Quantified metrics from tweet analysis"""
     total_tweets_analyzed: int
@@ -187,14 +312,14 @@ class SignalMetrics:
             "total_tweets_analyzed": self.total_tweets_analyzed,
             "verified_tweets": self.verified_tweets,
             "engagement_score": self.engagement_score,
-            "sentiment_breakdown": {s.value: c for s, c in self.sentiment_breakdown.items()},
-            "dominant_sentiment": self.dominant_sentiment.value,
+            "sentiment_breakdown": {_SENTIMENT_VALUE[s]: c for s, c in self.sentiment_breakdown.items()},
+            "dominant_sentiment": _SENTIMENT_VALUE[self.dominant_sentiment],
             "key_themes": self.key_themes,
             "top_mentioned_entities": self.top_mentioned_entities
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SignalAnalysisResponse:
     """Grok's analysis of tweets: quantified signal strength"""
     event_id: str
@@ -212,14 +337,14 @@ class SignalAnalysisResponse:
             "analysis_timestamp": self.analysis_timestamp,
             "metrics": self.metrics.to_dict(),
             "overall_signal_strength": self.overall_signal_strength,
-            "signal_confidence": self.signal_confidence.value,
+            "signal_confidence": self.signal_confidence._v,
             "interpretation": self.interpretation,
             "prediction_market_implication": self.prediction_market_implication,
             "recommended_next_steps": self.recommended_next_steps
         }
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict(), indent=2)
+        return _dumps_indented(self.to_dict())
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> "SignalAnalysisResponse":
@@ -253,7 +378,64 @@ class SignalAnalysisResponse:
 # STEP 4: Signal Persistence & Time-Series Tracking
 # ============================================================================
 
-@dataclass
+# Snapshots retained per event; trend logic only ever reads the recent tail,
+# so per-minute ingestion must not grow memory forever
+SNAPSHOT_RETENTION = 1024
+
+
+class RingBuffer:
+    """
+    Fixed-capacity ring buffer with O(1) append and indexing.
+
+    Keeps the most recent `capacity` items, overwriting the oldest once
+    full. Iteration and slicing yield oldest-first.
+    """
+
+    __slots__ = ("_items", "_capacity", "_head", "_size")
+
+    def __init__(self, capacity: int, items=()):
+        self._capacity = capacity
+        self._items: List[Any] = [None] * capacity
+        self._head = 0  # index of the oldest element
+        self._size = 0
+        for item in items:
+            self.append(item)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def append(self, item: Any) -> None:
+        if self._size < self._capacity:
+            self._items[(self._head + self._size) % self._capacity] = item
+            self._size += 1
+        else:
+            self._items[self._head] = item
+            self._head = (self._head + 1) % self._capacity
+
+    def tail(self, k: int) -> List[Any]:
+        """Last k items, oldest-first."""
+        k = min(k, self._size)
+        return [self[self._size - k + i] for i in range(k)]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("RingBuffer index out of range")
+        return self._items[(self._head + index) % self._capacity]
+
+    def __iter__(self):
+        for i in range(self._size):
+            yield self._items[(self._head + i) % self._capacity]
+
+
+@dataclass(frozen=True, slots=True)
 class SignalSnapshot:
     """A single point-in-time snapshot of signal for an event"""
     timestamp: str
@@ -262,19 +444,29 @@ class SignalSnapshot:
     tweet_count: int
     engagement_score: float
     key_themes: List[str]
+    # Snapshots are immutable, so the dict form is built once; serializing
+    # a long time series then just reuses these cached dicts
+    _cached: Dict[str, Any] = field(init=False, repr=False, compare=False)
 
-    def to_dict(self) -> Dict[str, Any]:
-        return {
+    def __post_init__(self):
+        object.__setattr__(
+            self, "key_themes", [_intern_theme(t) for t in self.key_themes]
+        )
+        object.__setattr__(self, "_cached", {
             "timestamp": self.timestamp,
             "signal_strength": self.signal_strength,
-            "sentiment": self.sentiment.value,
+            "sentiment": _SENTIMENT_VALUE[self.sentiment],
             "tweet_count": self.tweet_count,
             "engagement_score": self.engagement_score,
             "key_themes": self.key_themes
-        }
+        })
+
+    def to_dict(self) -> Dict[str, Any]:
+        # Shared cached dict - treat as read-only
+        return self._cached
 
 
-@dataclass
+@dataclass(slots=True)
 class EventSignalTimeSeries:
     """Track signal evolution for a single event over time"""
     event_id: str
@@ -284,30 +476,99 @@ class EventSignalTimeSeries:
     current_signal_strength: float
     trend: str  # "increasing", "decreasing", "stable"
     estimated_resolution_time: Optional[str] = None
+    # Parallel flat buffers (SoA layout) for the numeric columns so trend
+    # and aggregation math never walks the snapshot objects
+    # attribute-by-attribute
+    _strengths: List[int] = field(default_factory=list, init=False, repr=False, compare=False)
+    _engagements: List[int] = field(default_factory=list, init=False, repr=False, compare=False)
+    _tweet_counts: List[int] = field(default_factory=list, init=False, repr=False, compare=False)
+    # Running sums so get_signal_trend is O(1) regardless of history length
+    _strength_sum: int = field(default=0, init=False, repr=False, compare=False)
+    _last5: deque = field(default_factory=lambda: deque(maxlen=5), init=False, repr=False, compare=False)
+    _last5_sum: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Snapshots live in a bounded ring (constructor input may be a plain
+        # list); the flat numeric buffers mirror its contents
+        if not isinstance(self.snapshots, RingBuffer):
+            self.snapshots = RingBuffer(SNAPSHOT_RETENTION, self.snapshots)
+        self._strengths = [_quantize_half_step(s.signal_strength) for s in self.snapshots]
+        self._engagements = [_quantize_half_step(s.engagement_score) for s in self.snapshots]
+        self._tweet_counts = [s.tweet_count for s in self.snapshots]
+        self._strength_sum = sum(self._strengths)
+        self._last5 = deque(self._strengths[-5:], maxlen=5)
+        self._last5_sum = sum(self._last5)
 
     def add_snapshot(self, snapshot: SignalSnapshot) -> None:
-        """Add a new signal reading"""
+        """Add a new signal reading (oldest entry drops once the ring is full)"""
+        if len(self.snapshots) == self.snapshots.capacity:
+            self._strength_sum -= self._strengths[0]
+            del self._strengths[0]
+            del self._engagements[0]
+            del self._tweet_counts[0]
         self.snapshots.append(snapshot)
+        strength_q = _quantize_half_step(snapshot.signal_strength)
+        self._strengths.append(strength_q)
+        self._engagements.append(_quantize_half_step(snapshot.engagement_score))
+        self._tweet_counts.append(snapshot.tweet_count)
+        # Maintain the running sums: add one, subtract the value leaving
+        # the 5-reading window
+        self._strength_sum += strength_q
+        if len(self._last5) == 5:
+            self._last5_sum -= self._last5[0]
+        self._last5.append(strength_q)
+        self._last5_sum += strength_q
         self.current_signal_strength = snapshot.signal_strength
 
+    def to_arrow(self):
+        """
+        Export the series as a pyarrow RecordBatch (zero-copy-friendly
+        columnar form for cross-event analytics in Polars/DuckDB).
+
+        Built from the flat SoA buffers, so no snapshot objects are walked.
+        Requires pyarrow; raises ImportError when it isn't installed.
+        """
+        import pyarrow as pa
+
+        return pa.RecordBatch.from_pydict({
+            "timestamp": [s.timestamp for s in self.snapshots],
+            "signal_strength": pa.array(
+                [v * 0.5 for v in self._strengths], type=pa.float32()
+            ),
+            "engagement_score": pa.array(
+                [v * 0.5 for v in self._engagements], type=pa.float32()
+            ),
+            "tweet_count": pa.array(self._tweet_counts, type=pa.int32()),
+            "sentiment": pa.array(
+                [s.sentiment.value for s in self.snapshots]
+            ).dictionary_encode(),
+        })
+
+    def recent_stats(self, k: int = 5) -> Dict[str, float]:
+        """Aggregate the numeric columns over the last k snapshots."""
+        if not self._strengths:
+            return {"signal_strength": 0.0, "engagement_score": 0.0, "tweet_count": 0.0}
+        strengths = self._strengths[-k:]
+        engagements = self._engagements[-k:]
+        tweet_counts = self._tweet_counts[-k:]
+        n = len(strengths)
+        # Dequantize the half-step buffers back to the 0-100 scale
+        return {
+            "signal_strength": sum(strengths) * 0.5 / n,
+            "engagement_score": sum(engagements) * 0.5 / n,
+            "tweet_count": sum(tweet_counts) / n,
+        }
+
     def get_signal_trend(self) -> str:
-        """Calculate trend from recent snapshots"""
-        if len(self.snapshots) < 2:
-            return "insufficient_data"
-        
-        recent = self.snapshots[-5:]  # Last 5 snapshots
-        if len(recent) < 2:
+        """Calculate trend from recent snapshots - O(1) via the running sums"""
+        n = len(self._strengths)
+        if n < 2:
             return "insufficient_data"
-        
-        avg_recent = sum(s.signal_strength for s in recent) / len(recent)
-        avg_before = sum(s.signal_strength for s in self.snapshots[:-5]) / (len(self.snapshots) - 5) if len(self.snapshots) > 5 else avg_recent
-        
-        if avg_recent > avg_before * 1.1:
-            return "increasing"
-        elif avg_recent < avg_before * 0.9:
-            return "decreasing"
-        else:
+        if n <= 5:
             return "stable"
+        avg_recent = self._last5_sum / len(self._last5)
+        avg_before = (self._strength_sum - self._last5_sum) / (n - len(self._last5))
+        return _classify_trend(avg_recent, avg_before)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -321,13 +582,61 @@ class EventSignalTimeSeries:
         }
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict(), indent=2, default=str)
+        """Compact JSON (production path - the pretty-printer is ~10x slower)."""
+        return _dumps_bytes(self.to_dict()).decode()
+
+    def to_json_pretty(self) -> str:
+        """Indented JSON for debugging/inspection."""
+        return _dumps_indented(self.to_dict())
+
+    def to_json_stream(self, fp) -> None:
+        """
+        Write the series as compact JSON to a binary file-like object
+        without materializing the full snapshot list.
+
+        to_dict holds every snapshot dict in memory at once; here each
+        snapshot's cached dict is encoded and written as it is visited, so
+        peak memory stays flat for long histories.
+        """
+        head = {
+            "event_id": self.event_id,
+            "event_description": self.event_description,
+            "created_at": self.created_at,
+            "current_signal_strength": self.current_signal_strength,
+            "trend": self.trend,
+            "estimated_resolution_time": self.estimated_resolution_time,
+        }
+        fp.write(_dumps_bytes(head)[:-1])  # keep the object open
+        fp.write(b',"snapshots":[')
+        for i, snapshot in enumerate(self.snapshots):
+            if i:
+                fp.write(b",")
+            fp.write(_dumps_bytes(snapshot.to_dict()))
+        fp.write(b"]}")
+
+
+def compute_trends(serieses: List[EventSignalTimeSeries]) -> List[str]:
+    """
+    Batch re-score trends for many event series in one pass.
+
+    This is the dashboard/cron path the trend kernel exists for: each
+    series' flat strength buffer goes straight through _trend_kernel
+    (AOT shared object or numba-compiled when available - see
+    grok_pipeline.build_native), so re-scoring thousands of events runs
+    native code instead of Python loops. Interactive single-series
+    callers should keep using get_signal_trend, which is O(1) via the
+    running sums.
+    """
+    return [_TREND_LABELS[_trend_kernel(series._strengths)] for series in serieses]
 
 
 # ============================================================================
 # Prompts for Grok (structured instructions)
 # ============================================================================
 
+# These prompts are frozen module constants: _call_grok marks them as
+# provider-side cache segments, so their bytes must stay identical across
+# calls (stripped of surrounding whitespace at definition).
 FILTER_SELECTION_SYSTEM_PROMPT = """
 You are an expert in prediction market signal detection. Given a prediction event, 
 you must intelligently select which filters to apply to detect high-signal tweets about that event.
@@ -353,7 +662,7 @@ For each event, respond with a JSON object containing:
 - search_time_window: "last_24h", "last_7d", or "last_30d"
 
 Be specific and strategic. Only recommend filters that will catch relevant signals.
-"""
+""".strip()
 
 SIGNAL_ANALYSIS_SYSTEM_PROMPT = """
 You are an expert financial analyst specializing in prediction market signal analysis.
@@ -384,5 +693,5 @@ Respond with a JSON object containing:
 - recommended_next_steps: Array of recommended actions
 
 Be analytical and quantitative. Avoid speculation.
-"""
+""".strip()
 
@@ -0,0 +1,139 @@
+"""
+Semantic response cache for near-duplicate tweet batches.
+
+Signal analysis often sees overlapping 25-tweet windows for the same event
+where the batch is only rearranged or marginally changed. Embedding a
+canonicalized digest of the batch and matching by cosine similarity lets
+those calls reuse the previous response instead of paying a full Grok call.
+
+When fastembed/faiss are not installed the cache degrades to exact-match
+on the canonical digest, which still catches pure reorderings.
+"""
+
+import hashlib
+import time
+from typing import Any, Dict, List, Optional
+
+# Optional embedding stack (CPU-only ~5ms embeddings + inner-product index)
+try:
+    from fastembed import TextEmbedding
+except ImportError:
+    TextEmbedding = None
+
+try:
+    import faiss
+    import numpy as np
+except ImportError:
+    faiss = None
+    np = None
+
+
+SIMILARITY_THRESHOLD = 0.92
+DEFAULT_TTL_SECONDS = 1800.0
+EMBEDDING_MODEL = "BAAI/bge-small-en-v1.5"
+
+# Bounds: flat FAISS indexes can't delete rows, so a full per-event index
+# is reset rather than grown forever; the exact tier is pruned and capped
+MAX_ENTRIES_PER_EVENT = 128
+MAX_EXACT_ENTRIES = 1024
+
+
+def canonicalize_tweets(tweets: List[Dict[str, Any]], limit: int = 25) -> str:
+    """Order-independent text digest of a tweet batch."""
+    return "\n".join(sorted(t.get("text", "") for t in tweets[:limit]))
+
+
+class SemanticCache:
+    """Per-event cache of analysis responses keyed by tweet-batch similarity."""
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self._ttl = ttl_seconds
+        # event_id -> faiss.IndexFlatIP over normalized embeddings
+        self._indexes: Dict[str, Any] = {}
+        # event_id -> list of (inserted_at, response), parallel to the index
+        self._entries: Dict[str, List[tuple]] = {}
+        # digest fallback: (event_id, sha256) -> (inserted_at, response)
+        self._exact: Dict[tuple, tuple] = {}
+
+        # Embedding model is loaded on first use: constructing it downloads
+        # and loads weights, which must not happen as an import side effect
+        self._model = None
+        self._model_resolved = False
+
+    def _get_model(self):
+        if not self._model_resolved:
+            self._model_resolved = True
+            if TextEmbedding is not None and faiss is not None:
+                self._model = TextEmbedding(EMBEDDING_MODEL)
+        return self._model
+
+    def _embed(self, text: str):
+        vector = np.asarray(list(self._model.embed([text]))[0], dtype="float32")
+        vector /= (np.linalg.norm(vector) or 1.0)
+        return vector.reshape(1, -1)
+
+    def get(self, event_id: str, tweets: List[Dict[str, Any]]) -> Optional[Any]:
+        """Return a cached response for a similar-enough batch, if any."""
+        canonical = canonicalize_tweets(tweets)
+
+        if self._get_model() is None:
+            digest = hashlib.sha256(canonical.encode()).hexdigest()
+            hit = self._exact.get((event_id, digest))
+            if hit and time.monotonic() - hit[0] < self._ttl:
+                return hit[1]
+            return None
+
+        index = self._indexes.get(event_id)
+        if index is None or index.ntotal == 0:
+            return None
+
+        scores, ids = index.search(self._embed(canonical), 1)
+        if scores[0][0] < SIMILARITY_THRESHOLD:
+            return None
+
+        inserted_at, response = self._entries[event_id][ids[0][0]]
+        if time.monotonic() - inserted_at >= self._ttl:
+            return None
+        return response
+
+    def put(self, event_id: str, tweets: List[Dict[str, Any]], response: Any) -> None:
+        """Store a fresh response for this batch."""
+        canonical = canonicalize_tweets(tweets)
+        now = time.monotonic()
+
+        if self._get_model() is None:
+            if len(self._exact) >= MAX_EXACT_ENTRIES:
+                self._prune_exact(now)
+            digest = hashlib.sha256(canonical.encode()).hexdigest()
+            self._exact[(event_id, digest)] = (now, response)
+            return
+
+        entries = self._entries.get(event_id)
+        if entries is not None and len(entries) >= MAX_ENTRIES_PER_EVENT:
+            # Flat indexes can't drop rows; reset this event's cache rather
+            # than letting index + entries grow without bound
+            del self._indexes[event_id]
+            del self._entries[event_id]
+
+        index = self._indexes.get(event_id)
+        if index is None:
+            vector = self._embed(canonical)
+            index = faiss.IndexFlatIP(vector.shape[1])
+            self._indexes[event_id] = index
+            self._entries[event_id] = []
+            index.add(vector)
+        else:
+            index.add(self._embed(canonical))
+        self._entries[event_id].append((now, response))
+
+    def _prune_exact(self, now: float) -> None:
+        """Drop expired exact-tier entries, then oldest-first down to the cap."""
+        expired = [
+            key for key, (inserted_at, _response) in self._exact.items()
+            if now - inserted_at >= self._ttl
+        ]
+        for key in expired:
+            del self._exact[key]
+        while len(self._exact) >= MAX_EXACT_ENTRIES:
+            # Dicts iterate in insertion order, so the first key is oldest
+            del self._exact[next(iter(self._exact))]
@@ -6,11 +6,49 @@ geopolitical events and collecting structured analysis responses.
 """
 
 import json
+import time
 from datetime import datetime
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from enum import Enum
 
+# orjson writes bytes directly ~3-5x faster than stdlib json; optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dump_model_json(model: BaseModel) -> bytes:
+    """
+    Fast JSON bytes for a response model.
+
+    model_dump(mode="json") pre-resolves enums and other rich types to
+    plain values so the encoder never hits per-field fallbacks; orjson
+    does the encode when installed, stdlib otherwise.
+    """
+    payload = model.model_dump(mode="json")
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
+
+# Timestamp cache: datetime.now().isoformat() costs several microseconds
+# (plus a syscall); batch construction of responses only needs
+# second-granularity stamps
+_now_cache_ts = 0.0
+_now_cache_value = ""
+
+
+def now_iso_cached() -> str:
+    """ISO timestamp refreshed at most once per second."""
+    global _now_cache_ts, _now_cache_value
+    t = time.time()
+    if t - _now_cache_ts > 1.0:
+        _now_cache_ts = t
+        _now_cache_value = datetime.fromtimestamp(t).isoformat()
+    return _now_cache_value
+
 
 class SentimentEnum(str, Enum):
     BULLISH = "bullish"
@@ -61,7 +99,7 @@ class HistoricalAnalysisResponse(BaseModel):
     """Structured response from historical analysis"""
     event_id: str
     event_description: str
-    analysis_timestamp: str
+    analysis_timestamp: str = Field(default_factory=now_iso_cached)
     
     # Overall assessment
     overall_sentiment: SentimentEnum
@@ -89,6 +127,121 @@ class HistoricalAnalysisResponse(BaseModel):
     # Recommendation
     recommendation: str
 
+    @classmethod
+    def build_unchecked(cls, **kwargs) -> "HistoricalAnalysisResponse":
+        """
+        Construct without validation for trusted, schema-enforced inputs.
+
+        Batch pipelines assembling responses from already-validated LLM
+        output skip the per-field enum coercion and bounds checks on every
+        nested SignalData.
+        """
+        for key in ("bullish_signals", "bearish_signals"):
+            kwargs[key] = [
+                SignalData.model_construct(**s) if isinstance(s, dict) else s
+                for s in kwargs.get(key, [])
+            ]
+        return cls.model_construct(**kwargs)
+
+
+# Built once at module load: TypeAdapter holds the compiled pydantic-core
+# SchemaValidator, so each parse below is a single Rust call instead of
+# re-deriving validator state
+_RESPONSE_ADAPTER: TypeAdapter = TypeAdapter(HistoricalAnalysisResponse)
+
+
+def parse_response(raw) -> HistoricalAnalysisResponse:
+    """Validate raw LLM JSON (str or bytes) into a HistoricalAnalysisResponse."""
+    return _RESPONSE_ADAPTER.validate_json(raw)
+
+
+# (category, question-text template, context requirements) for Q2-Q12.
+# Templates are module constants formatted per call with a tiny context
+# dict; Q1 stays dynamic because its text depends on optional
+# distance/timeline inputs.
+# Q1 static parts (its middle varies with optional distance/timeline data)
+_Q1_CATEGORY = "OFFENSIVE_PACE_PRECEDENT"
+_Q1_TAIL = " In the entire Ukraine conflict since 2022, what is the fastest sustained advance rate Russia has achieved over a multi-week period? Cite specific operations with dates, distances, and daily rates. Then assess the feasibility of a rapid military operation achieving the stated objective."
+_Q1_CONTEXT_REQUIREMENTS = "Access to military operations database, Ukraine conflict timeline, Russian advance rates"
+
+_QUESTION_TEMPLATES = (
+    (
+        "WINTER_WARFARE_IMPACT",
+        "Context: {event_description} This is winter in Eastern Ukraine (freezing temps, mud, reduced visibility). Historically, how much slower do Russian mechanized offensives move during winter months (December-February) compared to spring/summer? Provide specific data from 2022-23 and 2023-24 winter campaigns. What is the typical winter advance rate?",
+        "Seasonal warfare data, weather impact analysis, 2022-2024 operational records",
+    ),
+    (
+        "SUPPLY_LINE_CAPACITY",
+        "Context: Objective is deep in territory requiring extended supply lines. What is current ammunition expenditure rate per day? How does this compare to peak 2022 levels? If supply lines are disrupted (bridges, rails), can offensive operations be sustained at required pace for the timeline?",
+        "Russian logistics data, ammunition expenditure rates, supply line vulnerability assessment",
+    ),
+    (
+        "UKRAINIAN_DEFENSIVE_PRECEDENT",
+        "Context: {event_description} Ukraine has defended major cities despite being outnumbered (Kyiv, Kharkiv, Mariupol). Based on historical Ukrainian defensive performance in similar situations, how effective is prepared urban defense against Russian assault? What percentage of assaults on prepared Ukrainian defenses have succeeded vs. stalled?",
+        "Ukraine defense case studies, urban warfare outcomes, defensive effectiveness metrics",
+    ),
+    (
+        "MATH_FEASIBILITY",
+        "Context: The fastest Russian advances in Ukraine have been 5-10 km/day, but only for 1-2 weeks maximum. Is there ANY historical precedent for Russia sustaining such advances for extended periods while facing prepared defenses, in winter, over extended supply lines? What mathematical constraints limit offensive pace?",
+        "Military history database, advance rate analysis, statistical precedent",
+    ),
+    (
+        "FORCE_CONCENTRATION",
+        "Context: Reports suggest Russia is concentrating maximum forces at this objective. Historically, when Russia concentrates forces maximally at one point, how much faster do offensives progress? Can concentration overcome logistics/weather constraints? Cite 2022-2024 examples where force concentration succeeded or failed.",
+        "Russian concentration tactics, operational outcomes, force multiplier analysis",
+    ),
+    (
+        "MANPOWER_ATTRITION",
+        "Context: Russia has suffered massive casualties in 2024. Can military forces sustain an intensive assault while replacing 500-1000+ casualties per day? At what casualty rates do offensives slow or halt? Is current manpower sustainable for a multi-week intensive operation?",
+        "Casualty data, manpower availability, attrition rates 2024",
+    ),
+    (
+        "FORTIFICATION_STATUS",
+        "Context: Has Ukraine had time to fortify the objective? Compared to Mariupol (heavily fortified, ~90 days to fall) or Bakhmut (partially fortified, ~100 days), how fortified is the objective likely to be? Do prepared defenses add sufficient time to make a {days_remaining}-day capture mathematically impossible?",
+        "Fortification data, urban defense timelines, defensive advantage metrics",
+    ),
+    (
+        "BREAKTHROUGH_VS_CONSOLIDATION",
+        "Context: {event_description} Russia might achieve a breakthrough at one point, but capturing the entire objective requires sustained advance, then urban assault, then consolidation. How long have urban assaults historically taken (Mariupol, Severodonetsk, Soledar)? Can city conquest be completed in <{days_remaining} days from today, or is it typically a 60-90 day process?",
+        "Urban assault timelines, city conquest case studies, consolidation periods",
+    ),
+    (
+        "WEATHER_TIMING",
+        "Context: {event_description} When does mud season typically freeze over in Eastern Ukraine? December often still has mud. Is December a tactically favorable month for a major offensive, or do most Russian offensives accelerate in spring? What does historical timing tell us about offensive capability in late December?",
+        "Weather records, seasonal mud patterns, historical offensive timing",
+    ),
+    (
+        "POLITICAL_PRESSURE",
+        "Context: {event_description} Is there political pressure (Putin, military, domestic) to achieve this by the deadline for propaganda purposes? Historically, does political deadline pressure lead to reckless tactics, faster breakthroughs, or costly stalls? Can artificial deadlines accelerate real military capability?",
+        "Russian political analysis, propaganda objectives, leadership decision-making patterns",
+    ),
+    (
+        "SIGNAL_SYNTHESIS",
+        "Context: {event_description} After analyzing all historical precedents, what is the strongest evidence for (bullish) and against (bearish) this outcome by the deadline? Assign a confidence level to each directional signal. Provide an overall probability estimate (0-100) with detailed reasoning.",
+        "Synthesis of all previous analyses, probability assessment, confidence calibration",
+    ),
+)
+
+
+def _build_question_one(
+    event_description: str,
+    distance_km: Optional[float],
+    days_remaining: Optional[int],
+    required_daily_advance: Optional[float]
+) -> HistoricalQuestion:
+    """Build Q1, whose text varies with optional distance/timeline info."""
+    q1_text = f"Context: {event_description}"
+    if distance_km and days_remaining and required_daily_advance:
+        q1_text += f" Distance required: {distance_km} km in {days_remaining} days ({required_daily_advance:.1f} km/day)."
+    q1_text += _Q1_TAIL
+    return HistoricalQuestion.model_construct(
+        question_number=1,
+        category=_Q1_CATEGORY,
+        question_text=q1_text,
+        context_requirements=_Q1_CONTEXT_REQUIREMENTS,
+        can_fire_independently=True,
+    )
+
 
 def generate_historical_questions(
     event_description: str,
@@ -114,89 +267,31 @@ def generate_historical_questions(
     required_daily_advance = None
     if distance_km and days_remaining and days_remaining > 0:
         required_daily_advance = distance_km / days_remaining
-    
-    # Build Q1 with optional distance/timeline info
-    q1_text = f"Context: {event_description}"
-    if distance_km and days_remaining and required_daily_advance:
-        q1_text += f" Distance required: {distance_km} km in {days_remaining} days ({required_daily_advance:.1f} km/day)."
-    q1_text += " In the entire Ukraine conflict since 2022, what is the fastest sustained advance rate Russia has achieved over a multi-week period? Cite specific operations with dates, distances, and daily rates. Then assess the feasibility of a rapid military operation achieving the stated objective."
-    
+
+    # Inputs are controlled, so model_construct skips per-field validation
     questions = [
-        HistoricalQuestion(
-            question_number=1,
-            category="OFFENSIVE_PACE_PRECEDENT",
-            question_text=q1_text,
-            context_requirements="Access to military operations database, Ukraine conflict timeline, Russian advance rates"
-        ),
-        HistoricalQuestion(
-            question_number=2,
-            category="WINTER_WARFARE_IMPACT",
-            question_text=f"Context: {event_description} This is winter in Eastern Ukraine (freezing temps, mud, reduced visibility). Historically, how much slower do Russian mechanized offensives move during winter months (December-February) compared to spring/summer? Provide specific data from 2022-23 and 2023-24 winter campaigns. What is the typical winter advance rate?",
-            context_requirements="Seasonal warfare data, weather impact analysis, 2022-2024 operational records"
-        ),
-        HistoricalQuestion(
-            question_number=3,
-            category="SUPPLY_LINE_CAPACITY",
-            question_text=f"Context: Objective is deep in territory requiring extended supply lines. What is current ammunition expenditure rate per day? How does this compare to peak 2022 levels? If supply lines are disrupted (bridges, rails), can offensive operations be sustained at required pace for the timeline?",
-            context_requirements="Russian logistics data, ammunition expenditure rates, supply line vulnerability assessment"
-        ),
-        HistoricalQuestion(
-            question_number=4,
-            category="UKRAINIAN_DEFENSIVE_PRECEDENT",
-            question_text=f"Context: {event_description} Ukraine has defended major cities despite being outnumbered (Kyiv, Kharkiv, Mariupol). Based on historical Ukrainian defensive performance in similar situations, how effective is prepared urban defense against Russian assault? What percentage of assaults on prepared Ukrainian defenses have succeeded vs. stalled?",
-            context_requirements="Ukraine defense case studies, urban warfare outcomes, defensive effectiveness metrics"
-        ),
-        HistoricalQuestion(
-            question_number=5,
-            category="MATH_FEASIBILITY",
-            question_text="Context: The fastest Russian advances in Ukraine have been 5-10 km/day, but only for 1-2 weeks maximum. Is there ANY historical precedent for Russia sustaining such advances for extended periods while facing prepared defenses, in winter, over extended supply lines? What mathematical constraints limit offensive pace?",
-            context_requirements="Military history database, advance rate analysis, statistical precedent"
-        ),
-        HistoricalQuestion(
-            question_number=6,
-            category="FORCE_CONCENTRATION",
-            question_text=f"Context: Reports suggest Russia is concentrating maximum forces at this objective. Historically, when Russia concentrates forces maximally at one point, how much faster do offensives progress? Can concentration overcome logistics/weather constraints? Cite 2022-2024 examples where force concentration succeeded or failed.",
-            context_requirements="Russian concentration tactics, operational outcomes, force multiplier analysis"
-        ),
-        HistoricalQuestion(
-            question_number=7,
-            category="MANPOWER_ATTRITION",
-            question_text=f"Context: Russia has suffered massive casualties in 2024. Can military forces sustain an intensive assault while replacing 500-1000+ casualties per day? At what casualty rates do offensives slow or halt? Is current manpower sustainable for a multi-week intensive operation?",
-            context_requirements="Casualty data, manpower availability, attrition rates 2024"
-        ),
-        HistoricalQuestion(
-            question_number=8,
-            category="FORTIFICATION_STATUS",
-            question_text=f"Context: Has Ukraine had time to fortify the objective? Compared to Mariupol (heavily fortified, ~90 days to fall) or Bakhmut (partially fortified, ~100 days), how fortified is the objective likely to be? Do prepared defenses add sufficient time to make a {days_remaining}-day capture mathematically impossible?",
-            context_requirements="Fortification data, urban defense timelines, defensive advantage metrics"
-        ),
-        HistoricalQuestion(
-            question_number=9,
-            category="BREAKTHROUGH_VS_CONSOLIDATION",
-            question_text=f"Context: {event_description} Russia might achieve a breakthrough at one point, but capturing the entire objective requires sustained advance, then urban assault, then consolidation. How long have urban assaults historically taken (Mariupol, Severodonetsk, Soledar)? Can city conquest be completed in <{days_remaining} days from today, or is it typically a 60-90 day process?",
-            context_requirements="Urban assault timelines, city conquest case studies, consolidation periods"
-        ),
-        HistoricalQuestion(
-            question_number=10,
-            category="WEATHER_TIMING",
-            question_text=f"Context: {event_description} When does mud season typically freeze over in Eastern Ukraine? December often still has mud. Is December a tactically favorable month for a major offensive, or do most Russian offensives accelerate in spring? What does historical timing tell us about offensive capability in late December?",
-            context_requirements="Weather records, seasonal mud patterns, historical offensive timing"
-        ),
-        HistoricalQuestion(
-            question_number=11,
-            category="POLITICAL_PRESSURE",
-            question_text=f"Context: {event_description} Is there political pressure (Putin, military, domestic) to achieve this by the deadline for propaganda purposes? Historically, does political deadline pressure lead to reckless tactics, faster breakthroughs, or costly stalls? Can artificial deadlines accelerate real military capability?",
-            context_requirements="Russian political analysis, propaganda objectives, leadership decision-making patterns"
-        ),
-        HistoricalQuestion(
-            question_number=12,
-            category="SIGNAL_SYNTHESIS",
-            question_text=f"Context: {event_description} After analyzing all historical precedents, what is the strongest evidence for (bullish) and against (bearish) this outcome by the deadline? Assign a confidence level to each directional signal. Provide an overall probability estimate (0-100) with detailed reasoning.",
-            context_requirements="Synthesis of all previous analyses, probability assessment, confidence calibration"
-        ),
+        _build_question_one(
+            event_description, distance_km, days_remaining, required_daily_advance
+        )
     ]
-    
-    return HistoricalQuestionnaires(
+
+    ctx = {
+        "event_description": event_description,
+        "days_remaining": days_remaining,
+    }
+    questions.extend(
+        HistoricalQuestion.model_construct(
+            question_number=number,
+            category=category,
+            question_text=template.format_map(ctx),
+            context_requirements=context_requirements,
+            can_fire_independently=True,
+        )
+        for number, (category, template, context_requirements)
+        in enumerate(_QUESTION_TEMPLATES, 2)
+    )
+
+    return HistoricalQuestionnaires.model_construct(
         event_id=event_id,
         event_description=event_description,
         event_deadline=event_deadline,
@@ -208,6 +303,74 @@ def generate_historical_questions(
     )
 
 
+def generate_historical_questions_batch(
+    events: List[dict]
+) -> List[HistoricalQuestionnaires]:
+    """
+    Generate questionnaires for a portfolio of events in one pass.
+
+    The formatting loops are transposed - outer over the templates, inner
+    over events - so each template string stays hot in cache while all N
+    texts for it are produced; the models are then assembled per event.
+
+    Each event dict takes the same keys as generate_historical_questions
+    (event_description, event_id, plus optional event_deadline,
+    distance_km, days_remaining).
+    """
+    contexts = [
+        {
+            "event_description": e["event_description"],
+            "days_remaining": e.get("days_remaining"),
+        }
+        for e in events
+    ]
+
+    # texts_by_template[t][i] = template t formatted for event i
+    texts_by_template = [
+        [template.format_map(ctx) for ctx in contexts]
+        for _category, template, _reqs in _QUESTION_TEMPLATES
+    ]
+
+    questionnaires = []
+    for i, event in enumerate(events):
+        distance_km = event.get("distance_km")
+        days_remaining = event.get("days_remaining")
+        required_daily_advance = None
+        if distance_km and days_remaining and days_remaining > 0:
+            required_daily_advance = distance_km / days_remaining
+
+        questions = [
+            _build_question_one(
+                event["event_description"], distance_km, days_remaining,
+                required_daily_advance
+            )
+        ]
+        questions.extend(
+            HistoricalQuestion.model_construct(
+                question_number=number,
+                category=category,
+                question_text=texts_by_template[number - 2][i],
+                context_requirements=context_requirements,
+                can_fire_independently=True,
+            )
+            for number, (category, _template, context_requirements)
+            in enumerate(_QUESTION_TEMPLATES, 2)
+        )
+
+        questionnaires.append(HistoricalQuestionnaires.model_construct(
+            event_id=event["event_id"],
+            event_description=event["event_description"],
+            event_deadline=event.get("event_deadline"),
+            distance_to_objective_km=distance_km,
+            days_remaining=days_remaining,
+            required_daily_advance_km=required_daily_advance,
+            questions=questions,
+            total_questions=len(questions)
+        ))
+
+    return questionnaires
+
+
 def demo_question_generation():
     """Demo: Generate questions for Pokrovsk event"""
     print("=" * 80)
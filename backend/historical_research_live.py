@@ -4,33 +4,56 @@ Historical Research with LIVE Grok API Integration
 This version actually calls the xAI API to answer historical questions.
 """
 
+import hashlib
 import json
 import os
+import re
+import sqlite3
+import time
 import asyncio
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 from enum import Enum
 from pathlib import Path
 
-# Load .env file
+# Tolerant partial-JSON parser for decoding the synthesis stream while it
+# is still arriving (pydantic-core >= 2.x)
+try:
+    from pydantic_core import from_json as _partial_from_json
+except ImportError:
+    _partial_from_json = None
+
+# Optional embedding stack for the semantic cache tier
+try:
+    from fastembed import TextEmbedding
+    import numpy as np
+except ImportError:
+    TextEmbedding = None
+    np = None
+
+# Load .env file (once per process - guard keeps repeat imports from
+# reparsing the file)
 try:
     from dotenv import load_dotenv
     env_path = Path(__file__).parent / '.env'
     load_dotenv(env_path)
 except ImportError:
     # dotenv not installed, try manual loading
-    env_path = Path(__file__).parent / '.env'
-    if env_path.exists():
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key] = value
+    if not os.environ.get("_ENV_LOADED"):
+        env_path = Path(__file__).parent / '.env'
+        if env_path.exists():
+            with open(env_path) as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith('#') and '=' in line:
+                        key, value = line.split('=', 1)
+                        os.environ.setdefault(key.strip(), value.strip())
+        os.environ["_ENV_LOADED"] = "1"
 
 # Import existing models
 from historical_research import (
+    now_iso_cached,
     SentimentEnum,
     ConfidenceEnum,
     HistoricalQuestion,
@@ -62,6 +85,11 @@ class HistoricalAnswer(BaseModel):
     signal_strength: float = Field(..., ge=0, le=100)
 
 
+# Serialized once: schema generation walks the model graph and its output
+# never changes between calls
+_HISTORICAL_ANSWER_SCHEMA_JSON = json.dumps(HistoricalAnswer.model_json_schema(), indent=2)
+
+
 HISTORICAL_ANALYSIS_SYSTEM_PROMPT = """You are a military historian and geopolitical analyst specializing in quantitative conflict analysis and Reference Class Forecasting.
 
 Your goal is to provide objective, data-driven analysis of future events based on historical precedents.
@@ -98,6 +126,9 @@ Return a JSON object with a list of questions. Each question must have:
 - question_text: The detailed question to ask.
 - context_requirements: What data is needed to answer it.
 
+When a question refers to the event or its deadline, quote the EVENT and
+DEADLINE text above verbatim - do not paraphrase them.
+
 JSON SCHEMA:
 {{
   "questions": [
@@ -134,6 +165,200 @@ Return JSON:
 """
 
 
+# Question sets are reusable across events of the same class ("will X
+# capture Y", "will X be impeached", ...): the concrete event parameters
+# travel in each question's context block, not in the question list itself.
+_EVENT_CLASS_PATTERNS = (
+    ("territorial_capture", re.compile(r"\b(captures?|seizes?|capture of|seizure of|falls? to|full control of)\b", re.I)),
+    ("impeachment", re.compile(r"\bimpeach", re.I)),
+    ("ceasefire", re.compile(r"\b(ceasefire|truce|peace deal|armistice)\b", re.I)),
+    ("resignation", re.compile(r"\b(resigns?|resignation|steps? down|ousted)\b", re.I)),
+    ("election", re.compile(r"\b(elections?|ballots?|elected|wins? the (?:presidency|election))\b", re.I)),
+)
+
+
+def _event_template_key(event_description: str) -> str:
+    """Cheap keyword classifier mapping an event to a question-template class."""
+    for key, pattern in _EVENT_CLASS_PATTERNS:
+        if pattern.search(event_description):
+            return key
+    return "generic"
+
+
+def _reparameterize_question(
+    question_text: str,
+    source_description: str,
+    new_description: str,
+    source_deadline: Optional[str],
+    new_deadline: Optional[str]
+) -> str:
+    """
+    Swap the source event's verbatim description/deadline for the new
+    event's in a cached question. Callers must verify containment first
+    (see _reuse_cached_questions); substitution over paraphrased text
+    would leave the old event's wording in place.
+    """
+    text = question_text.replace(source_description, new_description)
+    if source_deadline and new_deadline:
+        text = text.replace(source_deadline, new_deadline)
+    return text
+
+
+def _reuse_cached_questions(
+    cached: dict,
+    new_description: str,
+    new_deadline: Optional[str]
+) -> Optional[List[dict]]:
+    """
+    Re-parameterize a cached question set for a new event, or return None
+    to force fresh generation.
+
+    Reuse is refused unless every cached question references the source
+    event verbatim (and its deadline verbatim, wherever a deadline is
+    mentioned) - if Grok paraphrased despite the prompt instruction, a
+    blind substitution would silently research the wrong event.
+    """
+    source_description = cached["event_description"]
+    source_deadline = cached["event_deadline"]
+
+    for q in cached["questions"]:
+        text = q.get("question_text") or ""
+        if source_description not in text:
+            return None
+        if source_deadline and not new_deadline and source_deadline in text:
+            # The question pins the old deadline and we have none to swap in
+            return None
+
+    return [
+        {
+            **q,
+            "question_text": _reparameterize_question(
+                q.get("question_text") or "",
+                source_description, new_description,
+                source_deadline, new_deadline,
+            ),
+        }
+        for q in cached["questions"]
+    ]
+
+
+# class key -> {questions, event_description, event_deadline} from a
+# previous Grok generation; question_text is re-parameterized on reuse
+_question_class_cache: Dict[str, dict] = {}
+
+
+class HistoricalAnswerCache:
+    """
+    Two-tier cache for historical question answers.
+
+    Exact tier: sha256 of the rendered prompt -> answer JSON, persisted in
+    SQLite under ~/.cache/polymarket_hist/ so warm answers survive process
+    restarts and cost zero API spend. Semantic tier (optional, needs
+    fastembed + numpy): cosine similarity over stored question-text
+    embeddings, reusing answers to near-identical questions asked for
+    other events.
+    """
+
+    SIMILARITY_THRESHOLD = 0.92
+
+    def __init__(self, directory: Optional[str] = None, ttl_seconds: float = 86400.0):
+        base = Path(directory) if directory else Path.home() / ".cache" / "polymarket_hist"
+        base.mkdir(parents=True, exist_ok=True)
+        self._ttl = ttl_seconds
+        # check_same_thread=False: calls arrive from the shared background loop
+        self._db = sqlite3.connect(str(base / "answers.db"), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS answers ("
+            "prompt_hash TEXT PRIMARY KEY, question_text TEXT, "
+            "embedding BLOB, answer_json TEXT, ts REAL)"
+        )
+        self._db.commit()
+
+        # Embedding model resolves on first use: constructing it can
+        # download/initialize weights, which must neither block __init__
+        # nor be able to take the whole cache down
+        self._model = None
+        self._model_resolved = False
+
+    def _get_model(self):
+        if not self._model_resolved:
+            self._model_resolved = True
+            if TextEmbedding is not None and np is not None:
+                try:
+                    self._model = TextEmbedding("sentence-transformers/all-MiniLM-L6-v2")
+                except Exception as e:
+                    print(f"⚠️ Semantic answer-cache tier unavailable: {e}")
+        return self._model
+
+    def _embed(self, text: str):
+        vector = np.asarray(list(self._model.embed([text]))[0], dtype="float32")
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else vector
+
+    def get(self, user_prompt: str, question_text: str) -> Optional[str]:
+        """Return cached answer JSON for this prompt (or a near-duplicate)."""
+        prompt_hash = hashlib.sha256(user_prompt.encode()).hexdigest()
+        cutoff = time.time() - self._ttl
+        row = self._db.execute(
+            "SELECT answer_json FROM answers WHERE prompt_hash = ? AND ts > ?",
+            (prompt_hash, cutoff),
+        ).fetchone()
+        if row is not None:
+            return row[0]
+
+        if self._get_model() is None:
+            return None
+
+        # Semantic tier: best cosine match over the stored question texts
+        rows = self._db.execute(
+            "SELECT embedding, answer_json FROM answers WHERE embedding IS NOT NULL AND ts > ?",
+            (cutoff,),
+        ).fetchall()
+        if not rows:
+            return None
+
+        query = self._embed(question_text)
+        matrix = np.frombuffer(
+            b"".join(r[0] for r in rows), dtype="float32"
+        ).reshape(len(rows), -1)
+        scores = matrix @ query
+        best = int(scores.argmax())
+        if scores[best] >= self.SIMILARITY_THRESHOLD:
+            return rows[best][1]
+        return None
+
+    def put(self, user_prompt: str, question_text: str, answer_json: str) -> None:
+        prompt_hash = hashlib.sha256(user_prompt.encode()).hexdigest()
+        embedding = self._embed(question_text).tobytes() if self._get_model() is not None else None
+        self._db.execute(
+            "INSERT OR REPLACE INTO answers (prompt_hash, question_text, embedding, answer_json, ts) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (prompt_hash, question_text, embedding, answer_json, time.time()),
+        )
+        self._db.commit()
+
+
+# Lazy init: building the cache touches ~/.cache and opens SQLite, which
+# must not be able to break module import (and server boot) on hosts with
+# a read-only or unset HOME. Disabled after a failed attempt.
+_answer_cache: Optional[HistoricalAnswerCache] = None
+_answer_cache_disabled = False
+
+
+def _get_answer_cache() -> Optional[HistoricalAnswerCache]:
+    global _answer_cache, _answer_cache_disabled
+    if _answer_cache is None and not _answer_cache_disabled:
+        try:
+            _answer_cache = HistoricalAnswerCache()
+        except Exception as e:
+            # The cache is an optimization - any constructor failure
+            # (filesystem, sqlite, anything else) must disable it rather
+            # than re-raise from every question
+            print(f"⚠️ Historical answer cache unavailable: {e}")
+            _answer_cache_disabled = True
+    return _answer_cache
+
+
 # --- Singleton GrokClient ---
 # The GrokClient is stateless (no conversation context).
 # Each _call_grok creates fresh messages.
@@ -232,18 +457,44 @@ class HistoricalResearchClient:
         
         yield {"type": "log", "message": f"📋 Generated {questionnaire.total_questions} research questions"}
         yield {"type": "log", "message": "🤖 Querying Grok API for historical analysis..."}
-        
-        # Step 2: Ask Grok all questions and collect answers
+
+        # Step 2: Ask Grok all questions concurrently - the questions are
+        # independent, so the phase costs max-of-RTTs instead of the sum.
+        # Failures come back as values so one bad question neither aborts
+        # the phase nor orphans its running siblings.
+        async def _ask_pair(question):
+            try:
+                return question, await self._ask_question(question, questionnaire)
+            except Exception as e:
+                return question, e
+
+        tasks = [
+            asyncio.create_task(_ask_pair(q)) for q in questionnaire.questions
+        ]
         answers = []
-        for i, question in enumerate(questionnaire.questions, 1):
-            yield {"type": "log", "message": f"  [{i}/{questionnaire.total_questions}] Investigating: {question.category}..."}
-            
-            answer = await self._ask_question(question, questionnaire)
-            answers.append({
-                "question": question,
-                "answer": answer
-            })
-            yield {"type": "log", "message": f"  ✓ Answered: {question.category}"}
+        try:
+            for done, pending in enumerate(asyncio.as_completed(tasks), 1):
+                question, answer = await pending
+                if isinstance(answer, Exception):
+                    yield {"type": "log", "message": f"  [{done}/{questionnaire.total_questions}] ✗ {question.category} failed: {answer}"}
+                    continue
+                answers.append({
+                    "question": question,
+                    "answer": answer
+                })
+                yield {"type": "log", "message": f"  [{done}/{questionnaire.total_questions}] ✓ Answered: {question.category}"}
+        finally:
+            # Consumer bailed mid-stream (or we're unwinding): don't leave
+            # in-flight Grok calls running unawaited
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+        if not answers:
+            raise RuntimeError("All research questions failed; cannot synthesize an analysis")
+
+        # Restore questionnaire order for the synthesis transcript
+        answers.sort(key=lambda item: item["question"].question_number)
         
         # Step 3: Deep Dive Check (Iterative Research)
         yield {"type": "log", "message": "🕵️  Analyzing initial findings for gaps..."}
@@ -255,23 +506,38 @@ class HistoricalResearchClient:
         
         if deep_dive_questions:
             yield {"type": "log", "message": f"🔍 Deep Dive: Generated {len(deep_dive_questions)} follow-up questions"}
-            for i, question in enumerate(deep_dive_questions, 1):
-                yield {"type": "log", "message": f"  [DD-{i}] Investigating: {question.category}..."}
-                answer = await self._ask_question(question, questionnaire)
-                answers.append({
-                    "question": question,
-                    "answer": answer
-                })
-                yield {"type": "log", "message": f"  ✓ Answered: {question.category}"}
+            dd_tasks = [
+                asyncio.create_task(_ask_pair(q)) for q in deep_dive_questions
+            ]
+            try:
+                for done, pending in enumerate(asyncio.as_completed(dd_tasks), 1):
+                    question, answer = await pending
+                    if isinstance(answer, Exception):
+                        yield {"type": "log", "message": f"  [DD-{done}] ✗ {question.category} failed: {answer}"}
+                        continue
+                    answers.append({
+                        "question": question,
+                        "answer": answer
+                    })
+                    yield {"type": "log", "message": f"  [DD-{done}] ✓ Answered: {question.category}"}
+            finally:
+                for task in dd_tasks:
+                    if not task.done():
+                        task.cancel()
         
         yield {"type": "log", "message": "🧠 Synthesizing final analysis..."}
-        
-        # Step 4: Ask Grok to synthesize all answers into structured response
-        final_response = await self._synthesize_analysis(
+
+        # Step 4: Stream the synthesis, surfacing signals as they complete
+        final_response = None
+        async for event in self._stream_synthesis(
             questionnaire=questionnaire,
             answers=answers
-        )
-        
+        ):
+            if event["type"] == "synthesis_result":
+                final_response = event["data"]
+            else:
+                yield event
+
         yield {"type": "result", "data": final_response}
 
     async def _generate_questions_with_grok(
@@ -295,23 +561,47 @@ class HistoricalResearchClient:
             
         context_str = ", ".join(context_parts)
         
-        user_prompt = QUESTION_GENERATION_PROMPT.format(
-            event_description=event_description,
-            event_deadline=event_deadline or "Not specified",
-            context=context_str,
-            num_questions=6  # Ask for 6 high-quality questions
-        )
-        
-        response = await self.grok_client._call_grok(
-            system_prompt="You are a research planner.",
-            user_prompt=user_prompt,
-            temperature=0.4,
-            expect_json=True
-        )
-        
+        # Reuse a previously generated question set for this event class.
+        # The cache stores the source event's description/deadline alongside
+        # the questions so question_text can be re-parameterized - the
+        # generation prompt requires verbatim event references precisely so
+        # this substitution is reliable.
+        class_key = _event_template_key(event_description)
+        cached = _question_class_cache.get(class_key)
+
+        question_dicts = None
+        if cached is not None:
+            question_dicts = _reuse_cached_questions(
+                cached, event_description, event_deadline
+            )
+            if question_dicts is not None:
+                print(f"⚡ Reusing question templates for event class '{class_key}'")
+
+        if question_dicts is None:
+            user_prompt = QUESTION_GENERATION_PROMPT.format(
+                event_description=event_description,
+                event_deadline=event_deadline or "Not specified",
+                context=context_str,
+                num_questions=6  # Ask for 6 high-quality questions
+            )
+
+            response = await self.grok_client._call_grok(
+                system_prompt="You are a research planner.",
+                user_prompt=user_prompt,
+                temperature=0.4,
+                expect_json=True
+            )
+            question_dicts = response.get("questions", [])
+            if question_dicts:
+                _question_class_cache[class_key] = {
+                    "questions": question_dicts,
+                    "event_description": event_description,
+                    "event_deadline": event_deadline,
+                }
+
         # Parse response into HistoricalQuestion objects
         questions = []
-        for i, q_data in enumerate(response.get("questions", []), 1):
+        for i, q_data in enumerate(question_dicts, 1):
             questions.append(HistoricalQuestion(
                 question_number=i,
                 category=q_data.get("category", "GENERAL"),
@@ -337,13 +627,14 @@ class HistoricalResearchClient:
     ) -> List[HistoricalQuestion]:
         """Generate follow-up questions based on initial findings"""
         
-        # Summarize findings for the prompt
-        findings_summary = ""
+        # Summarize findings for the prompt (append/join, not += in a loop)
+        findings_parts = []
         for item in answers:
             q = item['question']
             a = item['answer']
-            findings_summary += f"Q: {q.question_text}\nA: {a.direct_answer} (Confidence: {a.confidence})\n\n"
-            
+            findings_parts.append(f"Q: {q.question_text}\nA: {a.direct_answer} (Confidence: {a.confidence})\n")
+        findings_summary = "\n".join(findings_parts)
+        
         user_prompt = DEEP_DIVE_PROMPT.format(
             event_description=questionnaire.event_description,
             findings_summary=findings_summary
@@ -389,9 +680,6 @@ Required Daily Advance: {questionnaire.required_daily_advance_km or 'N/A'} km/da
 Question Category: {question.category}
 """
         
-        # Get schema for strict JSON adherence
-        schema = HistoricalAnswer.model_json_schema()
-        
         user_prompt = f"""
 {context}
 
@@ -399,11 +687,18 @@ QUESTION:
 {question.question_text}
 
 Provide your answer as a valid JSON object matching this schema:
-{json.dumps(schema, indent=2)}
+{_HISTORICAL_ANSWER_SCHEMA_JSON}
 
 Ensure all fields are filled. For 'signal_strength', provide a value 0-100 where 0 is no signal and 100 is definitive proof.
 """
-        
+
+        # Warm answers (exact or near-duplicate questions) skip the API call
+        answer_cache = _get_answer_cache()
+        if answer_cache is not None:
+            cached_json = answer_cache.get(user_prompt, question.question_text)
+            if cached_json is not None:
+                return HistoricalAnswer.model_validate_json(cached_json)
+
         # Call Grok API
         response_dict = await self.grok_client._call_grok(
             system_prompt=HISTORICAL_ANALYSIS_SYSTEM_PROMPT,
@@ -412,33 +707,35 @@ Ensure all fields are filled. For 'signal_strength', provide a value 0-100 where
             max_tokens=2000,
             expect_json=True
         )
-        
+
         # Parse into Pydantic model
-        return HistoricalAnswer.model_validate(response_dict)
+        answer = HistoricalAnswer.model_validate(response_dict)
+        if answer_cache is not None:
+            answer_cache.put(user_prompt, question.question_text, answer.model_dump_json())
+        return answer
     
-    async def _synthesize_analysis(
+    def _build_synthesis_prompt(
         self,
         questionnaire: HistoricalQuestionnaires,
         answers: List[dict]
-    ) -> HistoricalAnalysisResponse:
-        """
-        Ask Grok to synthesize all answers into final structured response.
-        """
-        
-        # Format all Q&A for synthesis
-        qa_text = ""
+    ) -> str:
+        """Assemble the synthesis prompt from the collected Q&A transcript."""
+        # Format all Q&A for synthesis (append/join - repeated += over a
+        # transcript this size is accidentally quadratic)
+        qa_parts = []
         for i, item in enumerate(answers):
             q = item['question']
             a = item['answer']  # This is now a HistoricalAnswer object
-            
-            qa_text += f"Q{i+1} [{q.category}]: {q.question_text}\n"
-            qa_text += f"ANSWER: {a.direct_answer}\n"
-            qa_text += f"QUANTITATIVE: {a.quantitative_analysis}\n"
-            qa_text += f"SIGNAL: {a.signal_direction.value.upper()} (Strength: {a.signal_strength}/100)\n"
-            qa_text += "PRECEDENTS:\n"
+
+            qa_parts.append(f"Q{i+1} [{q.category}]: {q.question_text}\n")
+            qa_parts.append(f"ANSWER: {a.direct_answer}\n")
+            qa_parts.append(f"QUANTITATIVE: {a.quantitative_analysis}\n")
+            qa_parts.append(f"SIGNAL: {a.signal_direction.value.upper()} (Strength: {a.signal_strength}/100)\n")
+            qa_parts.append("PRECEDENTS:\n")
             for p in a.historical_precedents:
-                qa_text += f"  - {p.event_name} ({p.date_range}): {p.key_metrics} - {p.relevance_explanation}\n"
-            qa_text += "\n" + "-"*40 + "\n\n"
+                qa_parts.append(f"  - {p.event_name} ({p.date_range}): {p.key_metrics} - {p.relevance_explanation}\n")
+            qa_parts.append("\n" + "-"*40 + "\n\n")
+        qa_text = "".join(qa_parts)
         
         synthesis_prompt = f"""
 Based on the following historical research, provide a comprehensive analysis.
@@ -498,7 +795,18 @@ Respond with ONLY valid JSON in this exact format:
   "recommendation": "..."
 }}
 """
-        
+        return synthesis_prompt
+
+    async def _synthesize_analysis(
+        self,
+        questionnaire: HistoricalQuestionnaires,
+        answers: List[dict]
+    ) -> HistoricalAnalysisResponse:
+        """
+        Ask Grok to synthesize all answers into final structured response.
+        """
+        synthesis_prompt = self._build_synthesis_prompt(questionnaire, answers)
+
         # Call Grok for synthesis
         response = await self.grok_client._call_grok(
             system_prompt=HISTORICAL_ANALYSIS_SYSTEM_PROMPT,
@@ -506,7 +814,72 @@ Respond with ONLY valid JSON in this exact format:
             temperature=0.3,
             max_tokens=4000
         )
-        
+
+        return self._parse_synthesis_response(questionnaire, response)
+
+    async def _stream_synthesis(
+        self,
+        questionnaire: HistoricalQuestionnaires,
+        answers: List[dict]
+    ):
+        """
+        Stream the synthesis from Grok, decoding incrementally.
+
+        Yields {"type": "partial_signal", ...} events as bullish/bearish
+        entries complete mid-stream, then a final
+        {"type": "synthesis_result", "data": HistoricalAnalysisResponse}.
+        """
+        synthesis_prompt = self._build_synthesis_prompt(questionnaire, answers)
+
+        parts: List[str] = []
+        emitted = {"bullish_signals": 0, "bearish_signals": 0}
+        delta_count = 0
+
+        async for delta in self.grok_client._call_grok_stream(
+            system_prompt=HISTORICAL_ANALYSIS_SYSTEM_PROMPT,
+            user_prompt=synthesis_prompt,
+            temperature=0.3,
+            max_tokens=4000
+        ):
+            parts.append(delta)
+            delta_count += 1
+            if _partial_from_json is None or delta_count % 10:
+                continue
+
+            # Completeness heuristic: only attempt a decode when the buffer
+            # currently ends at a plausible JSON boundary
+            buffer = "".join(parts)
+            if not buffer.rstrip().endswith(("}", "]")):
+                continue
+            try:
+                partial = _partial_from_json(buffer, allow_partial=True)
+            except ValueError:
+                continue
+            if not isinstance(partial, dict):
+                continue
+
+            for side in ("bullish_signals", "bearish_signals"):
+                signals = partial.get(side)
+                if not isinstance(signals, list) or len(signals) <= 1:
+                    continue
+                # All but the last entry are guaranteed complete
+                for signal in signals[emitted[side]:len(signals) - 1]:
+                    yield {"type": "partial_signal", "side": side, "data": signal}
+                emitted[side] = max(emitted[side], len(signals) - 1)
+
+        # Final strict parse of the full buffer
+        response = self.grok_client._extract_json("".join(parts))
+        yield {
+            "type": "synthesis_result",
+            "data": self._parse_synthesis_response(questionnaire, response),
+        }
+
+    def _parse_synthesis_response(
+        self,
+        questionnaire: HistoricalQuestionnaires,
+        response: dict
+    ) -> HistoricalAnalysisResponse:
+        """Assemble the structured response from Grok's synthesis JSON."""
         # Helper to normalize confidence strings
         def normalize_confidence(conf_str: str) -> str:
             if not conf_str:
@@ -517,7 +890,7 @@ Respond with ONLY valid JSON in this exact format:
         return HistoricalAnalysisResponse(
             event_id=questionnaire.event_id,
             event_description=questionnaire.event_description,
-            analysis_timestamp=datetime.now().isoformat(),
+            analysis_timestamp=now_iso_cached(),
             
             overall_sentiment=SentimentEnum(response["overall_sentiment"]),
             overall_signal_strength=response["overall_signal_strength"],
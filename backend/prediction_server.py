@@ -31,7 +31,7 @@ from fastapi.responses import StreamingResponse
 from foundational_data import FoundationalDataService, FoundationalData
 from historical_research_live import HistoricalResearchClient, HistoricalAnalysisResponse
 from prominent_figure_service import generate_prominent_figures
-from analyze_prominent_figure_tweets import analyze_tweets_for_event, fetch_tweets_from_figures
+from analyze_prominent_figure_tweets import analyze_tweets_for_event, fetch_tweets_from_figures_async
 
 # Load environment variables
 load_dotenv(Path(__file__).parent / ".env")
@@ -604,8 +604,7 @@ Search for recent news, X/Twitter sentiment (including the Polymarket URL if pro
             logger.info(f"📱 [Prominent Figures Sentiment] Step 2: Fetching tweets (location={location})")
             
             all_keywords = [location] + location_variants
-            tweets_by_figure = await asyncio.to_thread(
-                fetch_tweets_from_figures,
+            tweets_by_figure = await fetch_tweets_from_figures_async(
                 figures=figures,
                 location_keywords=all_keywords,
                 days_back=7,
@@ -728,6 +727,10 @@ Search for recent news, X/Twitter sentiment (including the Polymarket URL if pro
                     yield f"event: log\ndata: {json.dumps({'source': source, 'message': event['message']})}\n\n"
                 elif event_type == "tool_call":
                     yield f"event: tool_call\ndata: {json.dumps({'source': source, 'tool': event['tool'], 'args': event.get('args', '')[:200]})}\n\n"
+                elif event_type == "tool_calls":
+                    # Batched/deduplicated upstream; fan out per item for the extension
+                    for item in event.get("items", []):
+                        yield f"event: tool_call\ndata: {json.dumps({'source': source, 'tool': item['tool'], 'args': item.get('args', '')[:200]})}\n\n"
                 elif event_type == "thinking":
                     yield f"event: thinking\ndata: {json.dumps({'source': source, 'tokens': event['tokens']})}\n\n"
                 elif event_type == "citations":